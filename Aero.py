@@ -3,15 +3,13 @@ import logging
 from Density_Calculator import main_density
 from Dynamic_viscosity_Calculator import dynamic_viscosity
 from Reynolds_Number_Calculator import main_reynolds
+from Aero_Logging import configure_logging
 
-# Configure logging to log everything (DEBUG level and above) and write to a file
-logging.basicConfig(filename='log.txt', filemode='a', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Version of the script
 __version__ = "0.46"
 
-logging.info(f"Starting Insert Data to Shop Floor script v{__version__}")
-
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
@@ -252,6 +250,9 @@ class Ui_MainWindow(object):
 
 if __name__ == "__main__":
     import sys
+    # Configure logging to log everything (DEBUG level and above) and write to a file
+    configure_logging('log.txt', logging.DEBUG)
+    logger.info("Starting Insert Data to Shop Floor script v%s", __version__)
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
@@ -0,0 +1,165 @@
+# Aero_Logging.py
+# Logging helpers shared by the calculator modules.
+#
+# Modules only create a logger (logging.getLogger(__name__)) and never configure
+# handlers at import; scripts call configure_logging from their __main__ block.
+# Messages use %-style arguments so nothing is formatted unless a record is
+# emitted, and per-station values are sent as one record per run with log_stations.
+# Long sweeps can use start_async_logging so file writes happen on a background thread.
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def configure_logging(filename='log.txt', level=logging.DEBUG, filemode='a'):
+    """
+    Send the log records of every module to filename. Meant for the __main__ block
+    of a script; library code must not call it.
+    """
+    logging.basicConfig(filename=filename, filemode=filemode, level=level, format=LOG_FORMAT)
+
+
+class StationTable:
+    def __init__(self, columns, precision=2):
+        """
+        Per-station values that are only formatted when the record is written.
+
+        Parameters:
+        columns (dict): Column name -> sequence of values, one value per station
+        precision (int): Decimals used when formatting
+        """
+        self.columns = columns
+        self.precision = precision
+
+    def __str__(self):
+        names = list(self.columns)
+        rows = [", ".join(names)]
+        for values in zip(*self.columns.values()):
+            rows.append(", ".join(f"{value:.{self.precision}f}" for value in values))
+        return "\n".join(rows)
+
+
+def log_stations(logger, message, level=logging.INFO, precision=2, **columns):
+    """
+    Log per-station results as a single structured record. The columns are
+    attached unformatted as record.stations for handlers that want the arrays,
+    and the table text is built only if the record is emitted.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, "%s\n%s", message, StationTable(columns, precision), extra={"stations": columns})
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, sink):
+        super().__init__(sink.queue)
+        self.sink = sink
+
+    def enqueue(self, record):
+        if self.sink.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.sink.dropped += 1
+
+
+class AsyncLogSink:
+    _STOP = object()
+
+    def __init__(self, filename, max_bytes=10 * 2**20, backup_count=5, queue_size=10000, batch_size=1000, block=False):
+        """
+        Log sink that writes records to a rotating file from a background thread.
+
+        Producers only put records on a bounded queue. The writer thread takes up to
+        batch_size records at a time, writes them and flushes the file once per batch.
+
+        Parameters:
+        filename (str): Log file, rotated into filename.1 ... filename.<backup_count>
+        max_bytes (int): Size at which the file is rotated
+        backup_count (int): Number of rotated files kept
+        queue_size (int): Maximum number of queued records, caps the memory use
+        batch_size (int): Maximum number of records written per flush
+        block (bool): Wait for space when the queue is full instead of dropping the record
+        """
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.block = block
+        self.dropped = 0
+        self._reported_dropped = 0
+        self.file_handler = logging.handlers.RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        self.file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.handler = _DroppingQueueHandler(self)
+        self._logger = None
+        self._thread = None
+
+    def start(self, logger=None, level=None):
+        # Attach to logger (the root logger by default) and start the writer thread
+        if self._thread is not None:
+            return self
+        self._logger = logger or logging.getLogger()
+        if level is not None:
+            self._logger.setLevel(level)
+        self._logger.addHandler(self.handler)
+        self._thread = threading.Thread(target=self._run, name='AsyncLogSink', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        # Detach, write everything still queued and close the file
+        if self._thread is None:
+            return
+        self._logger.removeHandler(self.handler)
+        self.queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+        self.file_handler.close()
+        atexit.unregister(self.stop)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is self._STOP:
+                batch.pop()
+                stopping = True
+            self._write(batch)
+
+    def _write(self, batch):
+        handler = self.file_handler
+        if self.dropped != self._reported_dropped:
+            batch.append(logging.makeLogRecord({'levelno': logging.WARNING, 'levelname': 'WARNING',
+                                                'msg': '%d log records dropped, the log queue was full', 'args': (self.dropped - self._reported_dropped,)}))
+            self._reported_dropped = self.dropped
+        if not batch:
+            return
+        for record in batch:
+            try:
+                if handler.shouldRollover(record):
+                    handler.doRollover()
+                if handler.stream is None:
+                    handler.stream = handler._open()
+                handler.stream.write(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+        handler.flush()
+
+
+def start_async_logging(filename='log.txt', level=logging.DEBUG, **kwargs):
+    """
+    Asynchronous alternative to configure_logging for long sweeps. Returns the
+    started AsyncLogSink; it is flushed and closed at exit or by calling stop().
+    Keyword arguments are passed to AsyncLogSink.
+    """
+    return AsyncLogSink(filename, **kwargs).start(level=level)
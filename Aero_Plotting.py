@@ -0,0 +1,68 @@
+# Aero_Plotting.py
+# Plotting kept apart from the calculations.
+#
+# Calculation modules never import matplotlib at import time; plot methods call
+# get_pyplot, which imports it on first use and selects the non-interactive Agg
+# backend unless a window was asked for. render_batch draws many figures in a
+# process pool, so a sweep can compute every case first and render afterwards.
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Backend used when figures are only saved to files
+HEADLESS_BACKEND = 'Agg'
+
+
+def get_pyplot(interactive=False):
+    """
+    Import matplotlib.pyplot on demand.
+
+    Parameters:
+    interactive (bool): Keep matplotlib's default (window) backend. Otherwise the
+                        Agg backend is used, unless pyplot was already imported.
+
+    Returns:
+    module: matplotlib.pyplot
+    """
+    if 'matplotlib.pyplot' not in sys.modules:
+        import matplotlib
+        if not interactive or not _has_display():
+            matplotlib.use(HEADLESS_BACKEND)
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _has_display():
+    return sys.platform in ('win32', 'darwin') or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+
+def finish_figure(plt, filename=None, show=False):
+    # Save the current figure and either show it or close it so batch runs do not accumulate figures
+    if filename is not None:
+        plt.savefig(filename)
+    if show:
+        plt.show()
+    else:
+        plt.close()
+
+
+def _headless_worker():
+    get_pyplot(interactive=False)
+
+
+def render_batch(render, jobs, max_workers=None):
+    """
+    Render many figures in a process pool with the headless backend.
+
+    Parameters:
+    render (callable): Module level function drawing and saving one figure, render(*job)
+    jobs (iterable): Argument tuples, one per figure
+    max_workers (int): Number of processes, defaults to the number of CPUs
+
+    Returns:
+    list: Return values of render, in the order of jobs
+    """
+    jobs = list(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_headless_worker) as executor:
+        return list(executor.map(render, *zip(*jobs))) if jobs else []
@@ -0,0 +1,233 @@
+# Airfoil_Polars.py
+# Registry of airfoil polars (alpha, CL, CD, CM and Reynolds number) loaded from
+# the files in the Polars folder. A polar is parsed on first use, kept in memory
+# as read-only NumPy arrays shared by every user, and cached on disk as .npz keyed
+# by the file hash and the cache format version so later runs skip the text parsing.
+
+import hashlib
+import os
+import re
+import zipfile
+import numpy as np
+
+# Folder with the polar files, one file per airfoil (and per Reynolds number)
+POLAR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Polars')
+
+# Extensions tried when looking up a polar by name
+POLAR_EXTENSIONS = ('.dat', '.txt', '.pol')
+
+# Column names understood by the parser, mapped to Polar attributes
+COLUMN_NAMES = {'alpha': 'alpha', 'cl': 'cl', 'cd': 'cd', 'cm': 'cm'}
+
+# Polar used by Lift when none is given
+DEFAULT_POLAR = 'goe_default'
+
+# Version of the parser and of the .npz layout. Part of the disk cache key, so bump it
+# whenever parse_polar or the cached arrays change and old cache files are ignored
+POLAR_CACHE_VERSION = 1
+
+# Suffix naming the Reynolds number of a polar file, e.g. goe227_Re200k or goe227_Re2e5
+REYNOLDS_SUFFIX = re.compile(r'_Re[\d.]+(?:[eE][-+]?\d+|[kKmM])?$')
+
+
+class Polar:
+    def __init__(self, name, alpha, cl, cd=None, cm=None, reynolds=np.nan):
+        """
+        Airfoil polar sorted by angle of attack.
+
+        Parameters:
+        name (str): Name of the airfoil
+        alpha (array): Angles of attack (degrees)
+        cl, cd, cm (array): Lift, drag and moment coefficients, NaN where not available
+        reynolds (float): Reynolds number of the polar, NaN when unknown
+        """
+        order = np.argsort(alpha, kind='stable')
+        self.name = name
+        self.reynolds = float(reynolds)
+        self.alpha = self._column(alpha, order)
+        self.cl = self._column(cl, order)
+        self.cd = self._column(cd, order)
+        self.cm = self._column(cm, order)
+
+    def _column(self, values, order):
+        if values is None:
+            values = np.full(len(order), np.nan)
+        column = np.ascontiguousarray(np.asarray(values, dtype=np.float64)[order])
+        column.flags.writeable = False  # Shared between every user of the polar
+        return column
+
+    def __repr__(self):
+        return f"Polar({self.name!r}, {len(self.alpha)} points, Re={self.reynolds:.3g})"
+
+
+def parse_polar(text, name='polar'):
+    """
+    Parse an XFOIL style polar. Lines that are not all numbers are skipped, the
+    first header line containing 'alpha' names the columns (alpha, CL, CD, CM by
+    default) and a 'Re = 0.500 e 6' line sets the Reynolds number.
+    """
+    columns = ['alpha', 'cl', 'cd', 'cm']
+    reynolds = np.nan
+    rows = []
+    for line in text.splitlines():
+        line = line.split('#', 1)[0]
+        match = re.search(r'Re\s*=\s*([-+\d.]+)\s*(?:e\s*([-+]?\d+))?', line)
+        if match:
+            reynolds = float(match.group(1)) * 10 ** int(match.group(2) or 0)
+            continue
+        tokens = line.split()
+        if not tokens:
+            continue
+        try:
+            rows.append([float(token) for token in tokens])
+        except ValueError:
+            if 'alpha' in [token.lower() for token in tokens]:
+                columns = [token.lower() for token in tokens]
+    if not rows:
+        raise ValueError(f"No polar data found for {name}")
+    width = min(len(row) for row in rows)
+    data = np.array([row[:width] for row in rows], dtype=np.float64)
+    values = {COLUMN_NAMES[column]: data[:, i] for i, column in enumerate(columns[:width]) if column in COLUMN_NAMES}
+    if 'alpha' not in values or 'cl' not in values:
+        raise ValueError(f"Polar {name} needs at least alpha and CL columns")
+    return Polar(name, reynolds=reynolds, **values)
+
+
+def airfoil_name(polar_name):
+    # Airfoil part of a polar file name, without the Reynolds number suffix
+    return REYNOLDS_SUFFIX.sub('', polar_name)
+
+
+class PolarTable:
+    def __init__(self, polars, alpha=None, name=None):
+        """
+        Polars of one airfoil at several Reynolds numbers, resampled onto a common
+        alpha grid so coefficients can be interpolated in both alpha and Reynolds.
+
+        Parameters:
+        polars (list): Polar objects, each with a known Reynolds number
+        alpha (array): Common alpha grid (degrees), defaults to every tabulated alpha
+        name (str): Name of the airfoil, defaults to the name of the first polar
+        """
+        polars = sorted(polars, key=lambda polar: polar.reynolds)
+        if not polars or any(np.isnan(polar.reynolds) for polar in polars):
+            raise ValueError("A polar table needs polars with known Reynolds numbers")
+        self.name = name or polars[0].name
+        self.reynolds = np.array([polar.reynolds for polar in polars])
+        self.alpha = np.unique(np.concatenate([polar.alpha for polar in polars])) if alpha is None else np.asarray(alpha, dtype=np.float64)
+        # (Reynolds x alpha) grids, clamped to the end values outside each polar
+        self.cl = np.array([np.interp(self.alpha, polar.alpha, polar.cl) for polar in polars])
+        self.cd = np.array([np.interp(self.alpha, polar.alpha, polar.cd) for polar in polars])
+        self.cm = np.array([np.interp(self.alpha, polar.alpha, polar.cm) for polar in polars])
+
+    @staticmethod
+    def _bracket(grid, values):
+        # Lower grid index and interpolation weight for every value, clamped to the grid
+        if len(grid) == 1:
+            return np.zeros(np.shape(values), dtype=np.intp), np.zeros(np.shape(values))
+        upper = np.clip(np.searchsorted(grid, values, side='right'), 1, len(grid) - 1)
+        lower = upper - 1
+        weight = np.clip((values - grid[lower]) / (grid[upper] - grid[lower]), 0.0, 1.0)
+        return lower, weight
+
+    def interpolate(self, coefficient, alpha, reynolds):
+        """
+        Bilinear interpolation of 'cl', 'cd' or 'cm' for alpha (degrees) and
+        reynolds, which are broadcast against each other (e.g. one alpha and an
+        array of spanwise Reynolds numbers).
+        """
+        table = getattr(self, coefficient)
+        alpha, reynolds = np.broadcast_arrays(np.asarray(alpha, dtype=np.float64), np.asarray(reynolds, dtype=np.float64))
+        i, wa = self._bracket(self.alpha, alpha)
+        j, wr = self._bracket(self.reynolds, reynolds)
+        i1 = np.minimum(i + 1, len(self.alpha) - 1)
+        j1 = np.minimum(j + 1, len(self.reynolds) - 1)
+        low = table[j, i] + wa * (table[j, i1] - table[j, i])
+        high = table[j1, i] + wa * (table[j1, i1] - table[j1, i])
+        return low + wr * (high - low)
+
+    def cl_at(self, alpha, reynolds):
+        return self.interpolate('cl', alpha, reynolds)
+
+    def __repr__(self):
+        return f"PolarTable({self.name!r}, Re={self.reynolds.tolist()})"
+
+
+class PolarRegistry:
+    def __init__(self, polar_dir=POLAR_DIR, cache_dir=None):
+        self.polar_dir = polar_dir
+        self.cache_dir = cache_dir or os.path.join(polar_dir, '.cache')
+        self._polars = {}
+        self._tables = {}
+
+    def available(self):
+        # Names of the polar files in the polar folder
+        if not os.path.isdir(self.polar_dir):
+            return []
+        return sorted(os.path.splitext(f)[0] for f in os.listdir(self.polar_dir) if f.endswith(POLAR_EXTENSIONS))
+
+    def path(self, name):
+        for extension in POLAR_EXTENSIONS:
+            path = os.path.join(self.polar_dir, name + extension)
+            if os.path.isfile(path):
+                return path
+        raise FileNotFoundError(f"No polar named {name!r} in {self.polar_dir}")
+
+    def get(self, name):
+        # Shared polar for name, loaded on first use
+        if name not in self._polars:
+            self._polars[name] = self.load(self.path(name), name)
+        return self._polars[name]
+
+    def get_table(self, name):
+        # Reynolds-indexed table from every polar file of the airfoil name, e.g. goe227 or goe227_Re200k
+        if name not in self._tables:
+            names = [n for n in self.available() if airfoil_name(n) == name]
+            if not names:
+                raise FileNotFoundError(f"No polars named {name!r} in {self.polar_dir}")
+            self._tables[name] = PolarTable([self.get(n) for n in names], name=name)
+        return self._tables[name]
+
+    def load(self, path, name=None):
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        with open(path, 'rb') as f:
+            raw = f.read()
+        key = hashlib.sha1(f"polar-cache-v{POLAR_CACHE_VERSION}\n".encode('ascii') + raw).hexdigest()
+        cache_file = os.path.join(self.cache_dir, key + '.npz')
+        if os.path.isfile(cache_file):
+            try:
+                with np.load(cache_file) as cached:
+                    return Polar(name, cached['alpha'], cached['cl'], cached['cd'], cached['cm'], cached['reynolds'])
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                pass  # Unreadable cache file, parse the polar again and rewrite it
+
+        polar = parse_polar(raw.decode('utf-8', errors='replace'), name)
+        temporary = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                np.savez(f, alpha=polar.alpha, cl=polar.cl, cd=polar.cd, cm=polar.cm, reynolds=polar.reynolds)
+            os.replace(temporary, cache_file)  # Readers never see a partly written cache file
+        except OSError:
+            # The disk cache is only an optimization
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+        return polar
+
+    def clear(self):
+        self._polars.clear()
+        self._tables.clear()
+
+
+# Registry shared by the whole project
+registry = PolarRegistry()
+
+
+def get_polar(name=DEFAULT_POLAR):
+    return registry.get(name)
+
+
+def get_polar_table(name):
+    return registry.get_table(name)
@@ -0,0 +1,103 @@
+# Atmosphere_Table.py
+# Fast front ends for the atmosphere and viscosity models used in trade studies:
+#  - AtmosphereTable precomputes the model on a fine grid and interpolates; queries
+#    outside the grid are evaluated with the exact models instead of being clamped
+#  - cached_density / cached_viscosity memoize the exact functions for repeated scalar queries
+
+import functools
+import numpy as np
+from Density_Calculator import R, calculate_atmosphere, main_density
+from Dynamic_viscosity_Calculator import dynamic_viscosity
+
+# Number of distinct scalar queries remembered by the memoizing front ends
+CACHE_SIZE = 1024
+
+
+class AtmosphereTable:
+    def __init__(self, max_altitude=5000.0, altitude_step=1.0, min_temperature=180.0, max_temperature=340.0, temperature_step=0.01):
+        """
+        Standard atmosphere and Sutherland viscosity tabulated for interpolation.
+
+        In the Density_Calculator model the temperature follows from the altitude and
+        the density is linear in humidity and barometric pressure, so the density is
+        stored as two altitude-only coefficients and stays exact in those inputs:
+            density = barometric_pressure * inverse_RT - humidity / 100 * saturated_vapor_term
+        The viscosity only depends on temperature and gets its own temperature grid.
+
+        Parameters:
+        max_altitude (float): Highest tabulated altitude (m), the table starts at 0 m
+        altitude_step (float): Altitude grid spacing (m)
+        min_temperature, max_temperature (float): Tabulated temperature range (K)
+        temperature_step (float): Temperature grid spacing (K)
+        """
+        self.altitudes = np.arange(0.0, max_altitude + altitude_step, altitude_step)
+        saturated = calculate_atmosphere(self.altitudes, 100.0, 0.0)
+        self.temperatures_at_altitude = saturated["temperature"]
+        self.pressures_at_altitude = saturated["pressure"]
+        self.inverse_RT = 1.0 / (R * saturated["temperature"])
+        self.saturated_vapor_term = saturated["vapor_pressure"] * self.inverse_RT
+
+        self.temperatures = np.arange(min_temperature, max_temperature + temperature_step, temperature_step)
+        self.viscosities = dynamic_viscosity(self.temperatures)
+
+    def temperature(self, altitude):
+        altitude = np.asarray(altitude, dtype=np.float64)
+        return _exact_outside(altitude, self.altitudes, np.interp(altitude, self.altitudes, self.temperatures_at_altitude),
+                              lambda: calculate_atmosphere(altitude, 0.0, 0.0)["temperature"])
+
+    def pressure(self, altitude):
+        altitude = np.asarray(altitude, dtype=np.float64)
+        return _exact_outside(altitude, self.altitudes, np.interp(altitude, self.altitudes, self.pressures_at_altitude),
+                              lambda: calculate_atmosphere(altitude, 0.0, 0.0)["pressure"])
+
+    def density(self, altitude, humidity, barometric_pressure):
+        # Interpolated equivalent of Density_Calculator.calculate_air_density, arrays are broadcast
+        altitude = np.asarray(altitude, dtype=np.float64)
+        inverse_RT = np.interp(altitude, self.altitudes, self.inverse_RT)
+        saturated_vapor_term = np.interp(altitude, self.altitudes, self.saturated_vapor_term)
+        density = np.asarray(barometric_pressure) * inverse_RT - np.asarray(humidity) / 100 * saturated_vapor_term
+        return _exact_outside(altitude, self.altitudes, density,
+                              lambda: calculate_atmosphere(altitude, humidity, barometric_pressure)["density"])
+
+    def viscosity(self, temperature):
+        # Interpolated equivalent of Dynamic_viscosity_Calculator.dynamic_viscosity
+        temperature = np.asarray(temperature, dtype=np.float64)
+        return _exact_outside(temperature, self.temperatures, np.interp(temperature, self.temperatures, self.viscosities),
+                              lambda: dynamic_viscosity(temperature))
+
+
+def _exact_outside(values, grid, interpolated, exact):
+    # Interpolated results inside the grid; points outside it (where np.interp would clamp) use exact()
+    outside = (values < grid[0]) | (values > grid[-1])
+    if not np.any(outside):
+        return interpolated
+    return np.where(outside, exact(), interpolated)[()]
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def cached_density(altitude, humidity, barometric_pressure):
+    """
+    Memoized Density_Calculator.main_density. The least recently used entries are
+    evicted once CACHE_SIZE different field conditions have been seen. The exact
+    model is memoized, not the table, so any altitude gives the exact density.
+    """
+    return main_density(altitude, humidity, barometric_pressure)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def cached_viscosity(temperature):
+    # Memoized Dynamic_viscosity_Calculator.dynamic_viscosity (exact at any temperature, not the table)
+    return dynamic_viscosity(temperature)
+
+
+def cache_stats():
+    # Hit/miss statistics of the memoizing front ends
+    return {
+        "density": cached_density.cache_info()._asdict(),
+        "viscosity": cached_viscosity.cache_info()._asdict(),
+    }
+
+
+def clear_caches():
+    cached_density.cache_clear()
+    cached_viscosity.cache_clear()
@@ -1,8 +1,9 @@
 import math
 import logging
+import numpy as np
+from Aero_Logging import configure_logging
 
-# Configure logging to log everything (DEBUG level and above) and write to a file
-logging.basicConfig(filename='log.txt', filemode='a', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Constants
 R = 287.05  # Specific gas constant for dry air, J/(kg·K)
@@ -15,15 +16,13 @@ def calculate_temperature(altitude):
     """
     Calculate the temperature at a given altitude using the standard atmosphere model.
     """
-    logging.info(f"Calculating temperature at {altitude} meters")
+    logger.debug("Calculating temperature at %s meters", altitude)
     return T0 - L * altitude
 
 def calculate_pressure(altitude):
     """
     Calculate the pressure at a given altitude using the barometric formula.
     """
-    temperature = calculate_temperature(altitude)
-    logging.info(f"Temperature at {altitude} meters is {temperature:.2f} K")
     return P0 * (1 - (L * altitude) / T0) ** (g / (R * L))
 
 def calculate_air_density(altitude, humidity, barometric_pressure):
@@ -31,33 +30,58 @@ def calculate_air_density(altitude, humidity, barometric_pressure):
     Calculate the air density at a given altitude, humidity, and barometric pressure.
     """
     temperature = calculate_temperature(altitude)
-    logging.info(f"Temperature at {altitude} meters is {temperature:.2f} K")
     pressure = calculate_pressure(altitude)
-    logging.info(f"Pressure at {altitude} meters is {pressure:.2f} Pa")
     
     # Adjust pressure for humidity
     # Assuming humidity is given as a percentage (e.g., 50 for 50%)
     vapor_pressure = humidity / 100 * 6.1078 * 10 ** ((7.5 * (temperature - 273.15)) / (temperature - 35.85))
-    logging.info(f"Vapor pressure at {temperature:.2f} K and {humidity}% humidity is {vapor_pressure:.2f} Pa")
     dry_air_pressure = barometric_pressure - vapor_pressure
-    logging.info(f"Dry air pressure at {temperature:.2f} K and {humidity}% humidity is {dry_air_pressure:.2f} Pa")
     
     # Calculate air density using the ideal gas law
     air_density = dry_air_pressure / (R * temperature)
-    logging.info(f"Air density at {temperature:.2f} K, {humidity}% humidity, and {barometric_pressure} Pa pressure is {air_density:.2f} kg/m^3)")
+    logger.debug("Temperature %.2f K, pressure %.2f Pa, vapor pressure %.2f Pa, dry air pressure %.2f Pa, air density %.2f kg/m^3 at %s meters and %s%% humidity",
+                 temperature, pressure, vapor_pressure, dry_air_pressure, air_density, altitude, humidity)
     return air_density
 
+def calculate_atmosphere(altitude, humidity, barometric_pressure):
+    """
+    Vectorized version of calculate_temperature, calculate_pressure and calculate_air_density.
+    Accepts scalars or NumPy arrays (broadcast against each other) and does no logging,
+    so large flight envelopes are evaluated in one pass.
+
+    Returns:
+    dict: temperature (K), pressure (Pa), vapor_pressure, dry_air_pressure and density (kg/m^3) arrays
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    humidity = np.asarray(humidity, dtype=float)
+    barometric_pressure = np.asarray(barometric_pressure, dtype=float)
+
+    temperature = T0 - L * altitude
+    pressure = P0 * (1 - (L * altitude) / T0) ** (g / (R * L))
+    vapor_pressure = humidity / 100 * 6.1078 * 10 ** ((7.5 * (temperature - 273.15)) / (temperature - 35.85))
+    dry_air_pressure = barometric_pressure - vapor_pressure
+    density = dry_air_pressure / (R * temperature)
+    return {
+        "temperature": temperature,
+        "pressure": pressure,
+        "vapor_pressure": vapor_pressure,
+        "dry_air_pressure": dry_air_pressure,
+        "density": density,
+    }
+
 def main_density(altitude, humidity, barometric_pressure):
     """
     Main function to calculate air density given altitude, humidity, and barometric pressure.
     """
-    logging.basicConfig(level=logging.INFO)
     density = calculate_air_density(altitude, humidity, barometric_pressure)
-    logging.info(f"Air density at {altitude} meters, {humidity}% humidity, and {barometric_pressure} Pa pressure is {density:.2f} kg/m^3")
+    logger.info("Air density at %s meters, %s%% humidity, and %s Pa pressure is %.2f kg/m^3", altitude, humidity, barometric_pressure, density)
     return density
 
 # Example usage
 if __name__ == "__main__":
+    # Configure logging to log everything (DEBUG level and above) and write to a file
+    configure_logging('log.txt', logging.DEBUG)
+
     # These values can be replaced by inputs from the GUI
     altitude = 1000  # Altitude in meters
     humidity = 50  # Humidity in percentage
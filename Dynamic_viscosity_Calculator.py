@@ -1,7 +1,7 @@
 import logging
+from Aero_Logging import configure_logging
 
-# Configure logging to log everything (DEBUG level and above) and write to a file
-logging.basicConfig(filename='log.txt', filemode='a', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 def dynamic_viscosity(temperature):
     """
@@ -26,13 +26,15 @@ def main_dynamic_viscocity(temperature):
     """
     Main function to calculate air density given altitude, humidity, and barometric pressure.
     """
-    logging.basicConfig(level=logging.INFO)
     viscocity = dynamic_viscosity(temperature)
-    logging.info(f"Dynamic viscosity of air at {temperature} K is {viscocity:.6e} Pa·s")
+    logger.info("Dynamic viscosity of air at %s K is %.6e Pa·s", temperature, viscocity)
     return viscocity
 
 # Example usage
 if __name__ == "__main__":
+    # Configure logging to log everything (DEBUG level and above) and write to a file
+    configure_logging('log.txt', logging.DEBUG)
+
     # These values can be replaced by inputs from the GUI
     temperature = 300  # Temperature in Kelvin
 
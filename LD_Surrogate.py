@@ -0,0 +1,193 @@
+# LD_Surrogate.py
+# Surrogate optimization of the lift to drag ratio over the angle of attack.
+#
+# Instead of differentiating through a full VLM at every optimizer iteration, the
+# VLM is sampled at a modest number of angles of attack (in parallel, through the
+# VLM_Cache), low order polynomials CL(alpha) and CD(alpha) are fitted to the
+# samples, and CL/CD is maximized on the polynomials: a dense vectorized grid
+# brackets the optimum and a golden-section search refines it. One more VLM solve
+# at the optimum verifies the result, so a whole optimization costs the samples
+# plus one solve.
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+from VLM_Cache import cached_vlm_run
+
+logger = logging.getLogger(__name__)
+
+# Number of VLM samples over the alpha range
+DEFAULT_SAMPLES = 7
+
+# Polynomial degrees of the CL and CD fits (CL is nearly linear, CD close to a parabola in alpha)
+CL_DEGREE = 2
+CD_DEGREE = 4
+
+# Points of the dense grid that brackets the surrogate optimum
+GRID_POINTS = 2001
+
+# Golden-section tolerance on alpha (degrees)
+ALPHA_TOLERANCE = 1e-6
+
+# Relative and absolute L/D difference between surrogate and verification solve above which one
+# more sample is added. The absolute part keeps the test meaningful where L/D is close to zero
+VERIFY_TOLERANCE = 1e-3
+VERIFY_ABS_TOLERANCE = 1e-3
+
+INVERSE_GOLDEN_RATIO = (np.sqrt(5) - 1) / 2
+
+
+def sample_points(alpha_bounds, n_samples=DEFAULT_SAMPLES):
+    # Chebyshev points of the alpha range, which keep the polynomial fits free of end oscillations
+    lower, upper = alpha_bounds
+    k = np.arange(n_samples)
+    return (lower + upper) / 2 - (upper - lower) / 2 * np.cos(np.pi * k / (n_samples - 1))
+
+
+def _sample(airplane, velocity, alpha, settings):
+    import aerosandbox as asb
+    aero, _, _ = cached_vlm_run(airplane, asb.OperatingPoint(velocity=velocity, alpha=float(alpha)), **settings)
+    return float(aero["CL"]), float(aero["CD"])
+
+
+def sample_vlm(airplane, velocity, alphas, max_workers=None, **settings):
+    """
+    CL and CD of the VLM at every angle of attack, solved in a process pool.
+
+    Parameters:
+    airplane (asb.Airplane): Geometry
+    velocity (float): Freestream velocity (m/s)
+    alphas (array): Angles of attack (degrees)
+    max_workers (int): Number of processes, 1 solves in this process
+    **settings: VortexLatticeMethod keyword arguments
+
+    Returns:
+    tuple: CL and CD arrays, one value per alpha
+    """
+    alphas = np.asarray(alphas, dtype=np.float64)
+    n = len(alphas)
+    if max_workers == 1 or n < 2:
+        samples = [_sample(airplane, velocity, alpha, settings) for alpha in alphas]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            samples = list(executor.map(_sample, repeat(airplane, n), repeat(velocity, n), alphas, repeat(settings, n)))
+    samples = np.array(samples, dtype=np.float64).reshape(n, 2)
+    return samples[:, 0], samples[:, 1]
+
+
+def golden_section(function, lower, upper, tolerance=ALPHA_TOLERANCE):
+    # Maximum of a unimodal function on [lower, upper]
+    a, b = lower, upper
+    c = b - INVERSE_GOLDEN_RATIO * (b - a)
+    d = a + INVERSE_GOLDEN_RATIO * (b - a)
+    fc, fd = function(c), function(d)
+    while b - a > tolerance:
+        if fc > fd:
+            b, d, fd = d, c, fc
+            c = b - INVERSE_GOLDEN_RATIO * (b - a)
+            fc = function(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + INVERSE_GOLDEN_RATIO * (b - a)
+            fd = function(d)
+    return (a + b) / 2
+
+
+class LDSurrogate:
+    def __init__(self, alphas, CL, CD, cl_degree=CL_DEGREE, cd_degree=CD_DEGREE):
+        """
+        Polynomial fits of CL(alpha) and CD(alpha) from VLM samples.
+
+        Parameters:
+        alphas (array): Sampled angles of attack (degrees)
+        CL, CD (array): VLM lift and drag coefficients at the samples
+        cl_degree, cd_degree (int): Polynomial degrees, lowered when there are too few samples
+        """
+        self.alphas = np.asarray(alphas, dtype=np.float64)
+        self.CL = np.asarray(CL, dtype=np.float64)
+        self.CD = np.asarray(CD, dtype=np.float64)
+        self.bounds = (self.alphas.min(), self.alphas.max())
+        n = len(self.alphas)
+        self.cl_coefficients = np.polyfit(self.alphas, self.CL, min(cl_degree, n - 1))
+        self.cd_coefficients = np.polyfit(self.alphas, self.CD, min(cd_degree, n - 1))
+
+    def evaluate(self, alpha):
+        # Surrogate CL, CD and CL/CD at alpha (scalar or array, degrees)
+        CL = np.polyval(self.cl_coefficients, alpha)
+        CD = np.polyval(self.cd_coefficients, alpha)
+        return CL, CD, CL / CD
+
+    def lift_to_drag(self, alpha):
+        return self.evaluate(alpha)[2]
+
+    def optimum(self, bounds=None, grid_points=GRID_POINTS, tolerance=ALPHA_TOLERANCE):
+        """
+        Angle of attack of maximum surrogate CL/CD.
+
+        Parameters:
+        bounds (tuple): Alpha range (degrees), defaults to the sampled range
+        grid_points (int): Points of the dense grid bracketing the maximum
+        tolerance (float): Golden-section tolerance (degrees)
+
+        Returns:
+        tuple: Alpha (degrees) and surrogate CL/CD at the optimum
+        """
+        lower, upper = self.bounds if bounds is None else bounds
+        grid = np.linspace(lower, upper, grid_points)
+        i = int(np.argmax(self.lift_to_drag(grid)))
+        alpha = golden_section(self.lift_to_drag, grid[max(i - 1, 0)], grid[min(i + 1, grid_points - 1)], tolerance)
+        return alpha, float(self.lift_to_drag(alpha))
+
+
+def optimize_lift_to_drag(airplane, velocity, alpha_bounds=(0.0, 10.0), n_samples=DEFAULT_SAMPLES, max_workers=None,
+                          verify_tolerance=VERIFY_TOLERANCE, verify_abs_tolerance=VERIFY_ABS_TOLERANCE, max_refinements=2, **settings):
+    """
+    Angle of attack of maximum CL/CD from a VLM surrogate, verified with one VLM solve.
+    When the verification differs from the surrogate by more than
+    verify_abs_tolerance + verify_tolerance * |L/D|, the verification solve becomes a
+    sample, the surrogate is refitted and optimized again.
+
+    Parameters:
+    airplane (asb.Airplane): Geometry
+    velocity (float): Freestream velocity (m/s)
+    alpha_bounds (tuple): Alpha range (degrees)
+    n_samples (int): Number of VLM samples for the first fit
+    max_workers (int): Processes used for sampling
+    verify_tolerance (float): Accepted relative L/D difference between surrogate and VLM
+    verify_abs_tolerance (float): Accepted absolute L/D difference between surrogate and VLM
+    max_refinements (int): Maximum number of refits with the verification solves
+    **settings: VortexLatticeMethod keyword arguments
+
+    Returns:
+    dict: 'alpha', 'L_over_D' (VLM), 'surrogate_L_over_D', 'CL', 'CD', 'aero' (VLM
+          result at the optimum), 'surrogate' (LDSurrogate) and 'vlm_solves'
+    """
+    alphas = sample_points(alpha_bounds, n_samples)
+    CL, CD = sample_vlm(airplane, velocity, alphas, max_workers, **settings)
+    solves = len(alphas)
+    for refinement in range(max_refinements + 1):
+        surrogate = LDSurrogate(alphas, CL, CD)
+        alpha, surrogate_ld = surrogate.optimum(alpha_bounds)
+        (CL_opt,), (CD_opt,) = sample_vlm(airplane, velocity, [alpha], 1, **settings)
+        solves += 1
+        L_over_D = CL_opt / CD_opt
+        converged = abs(L_over_D - surrogate_ld) <= verify_abs_tolerance + verify_tolerance * abs(L_over_D)
+        logger.debug("Surrogate optimum alpha %.4f deg: L/D %.4f (surrogate %.4f)", alpha, L_over_D, surrogate_ld)
+        if converged or refinement == max_refinements:
+            break
+        alphas, CL, CD = np.append(alphas, alpha), np.append(CL, CL_opt), np.append(CD, CD_opt)
+
+    import aerosandbox as asb
+    aero, _, _ = cached_vlm_run(airplane, asb.OperatingPoint(velocity=velocity, alpha=float(alpha)), **settings)
+    logger.info("Surrogate L/D optimization: alpha %.3f deg, L/D %.4f with %d VLM solves", alpha, L_over_D, solves)
+    return {
+        'alpha': alpha,
+        'L_over_D': L_over_D,
+        'surrogate_L_over_D': surrogate_ld,
+        'CL': CL_opt,
+        'CD': CD_opt,
+        'aero': aero,
+        'surrogate': surrogate,
+        'vlm_solves': solves,
+    }
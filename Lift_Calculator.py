@@ -4,33 +4,30 @@
 
 
 
-import matplotlib.pyplot as plt
+import numpy as np
 import math
 import logging
+from Airfoil_Polars import DEFAULT_POLAR, get_polar
+from Aero_Logging import configure_logging
+from Aero_Plotting import finish_figure, get_pyplot
 
-# Configure logging to log everything (DEBUG level and above) and write to a file
-logging.basicConfig(filename='log.txt', filemode='a', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Version of the script
 __version__ = "0.05"
 
-logging.info(f"Starting Lift_Calculator script v{__version__}")
-
 class Lift():
-    def __init__(self, velocity, density, wing_area, alpha):
+    def __init__(self, velocity, density, wing_area, alpha, polar=DEFAULT_POLAR):
         self.velocity = velocity
         self.density = density # Air rho = 1.225
         self.wing_area = wing_area
         self.alpha = alpha
         self.dynamic_pressure = 0
         
-        self.af_data_alpha = [
-        -12,-11.75,-11.25,-11,-10.75,-10.5,-10.25,-10,-9.75,-9.5,-9.25,-9,-8.75,-8.5,-8.25,-8,-7.75,-7.5,-7.25,-7,-6.75,-6.5,-6.25,-6,-5.75,-5.5,-5.25,-5,-4.75,-4.5,-4.25,-4,-3.75,-3.5,-3.25,-3,-2.75,-2.5,-2.25,-2,-1.75,-1.5,-1.25,-1,-0.75,-0.5,-0.25,0,0.25,0.5,0.75,1,1.25,1.5,1.75,2,2.25,2.5,2.75,3,3.25,3.5,3.75,4,4.25,4.5,4.75,5,5.25,5.5,5.75,6,6.25,6.5,6.75,7,7.25,7.5,7.75,8,8.25,8.5,8.75,9,9.25,9.5,9.75,10,10.25,10.5,10.75,11,11.25,11.5,11.75,12,12.25,12.5,12.75,13,13.25,13.5,13.75,14,14.25,14.5,14.75,15,15.25,15.5,15.75,16,16.25,16.5,16.75,17,17.25,17.5,17.75,18
-
-        ]
-        self.af_data_cl = [
-        -0.2925,-0.2904,-0.6446,-0.6274,-0.5983,-0.5693,-0.5463,-0.5198,-0.4987,-0.4739,-0.4551,-0.4386,-0.4169,-0.3945,-0.3724,-0.3499,-0.3273,-0.3037,-0.28,-0.2573,-0.2342,-0.2093,-0.184,-0.1591,-0.1329,-0.1089,-0.0833,-0.0569,-0.0309,-0.005,0.0211,0.0485,0.0749,0.1013,0.1285,0.1546,0.1809,0.2073,0.2343,0.2603,0.2863,0.3138,0.3396,0.3656,0.3925,0.4187,0.4443,0.4709,0.496,0.521,0.5461,0.5714,0.5966,0.6211,0.6458,0.6696,0.6865,0.8497,0.8715,0.892,0.9119,0.9311,0.9492,0.9674,0.9848,1.002,1.0195,1.0366,1.0535,1.0699,1.0859,1.101,1.1162,1.1314,1.1437,1.1531,1.1637,1.1768,1.1883,1.203,1.2147,1.2311,1.2447,1.2591,1.2744,1.2868,1.3037,1.3187,1.3309,1.3476,1.3635,1.3768,1.3896,1.4066,1.42,1.4314,1.4477,1.4587,1.4726,1.4822,1.4904,1.4814,1.4739,1.4495,1.4443,1.4441,1.4435,1.4382,1.4388,1.4371,1.433,1.4271,1.4173,1.4046,1.3966,1.3883,1.3786,1.3672,1.3557,1.3423
-        ]
+        # Polar shared with every other Lift using the same airfoil
+        self.polar = get_polar(polar) if isinstance(polar, str) else polar
+        self.af_data_alpha = self.polar.alpha
+        self.af_data_cl = self.polar.cl
 
     def calculate_dynamic_pressure(self, velocity, density):
         return (0.5 * density * pow(velocity, 2))
@@ -68,26 +65,50 @@ class Lift():
     def get_alpha(self):
         return self.alpha
 
-    def find_cl_from_alpha(self):
-        iter = 0
-        closest_value = self.af_data_alpha[0]
-        position = -1
-        for i in self.af_data_alpha:
-            if (self.alpha - self.af_data_alpha[iter]) >= 0:
-                closest_value = self.af_data_alpha[iter]
-                position = iter 
-            iter += 1
-        return self.af_data_cl[position]
-
-    def calculate_lift(self):
-        return (self.dynamic_pressure * self.find_cl_from_alpha() * self.wing_area)
+    def find_cl_from_alpha(self, alpha=None):
+        # Cl of the last tabulated alpha at or below alpha (no interpolation), alpha defaults to self.alpha and can be an array
+        position = np.searchsorted(self.af_data_alpha, self.alpha if alpha is None else alpha, side='right') - 1
+        cl = self.af_data_cl[position]
+        return float(cl) if np.ndim(cl) == 0 else cl
+
+    def interpolate_cl(self, alpha=None):
+        """
+        Linearly interpolated Cl for a scalar or an array of angles of attack (degrees).
+        Uses self.alpha when alpha is not given. Angles outside the table are clamped
+        to the first/last tabulated value.
+        """
+        alpha = np.asarray(self.alpha if alpha is None else alpha, dtype=float)
+        alphas = self.af_data_alpha
+        cls = self.af_data_cl
+        upper = np.clip(np.searchsorted(alphas, alpha, side='right'), 1, len(alphas) - 1)
+        lower = upper - 1
+        weight = np.clip((alpha - alphas[lower]) / (alphas[upper] - alphas[lower]), 0.0, 1.0)
+        cl = cls[lower] + weight * (cls[upper] - cls[lower])
+        return float(cl) if cl.ndim == 0 else cl
+
+    def interpolate_cl_spanwise(self, polar_table, reynolds_numbers, alpha=None):
+        """
+        Cl at every spanwise station from a Reynolds-indexed Airfoil_Polars.PolarTable,
+        e.g. with Reynolds_Number_Calculator.reynolds_numbers_at_positions.
+        Uses self.alpha when alpha is not given.
+        """
+        return polar_table.cl_at(self.alpha if alpha is None else alpha, reynolds_numbers)
+
+    def calculate_lift_curve(self, alphas):
+        # Lift for every angle of attack in alphas using the interpolated Cl
+        return self.dynamic_pressure * self.interpolate_cl(alphas) * self.wing_area
+
+    def calculate_lift(self, alpha=None):
+        # Lift at self.alpha, or at every angle of attack of the array alpha in one call
+        return (self.dynamic_pressure * self.find_cl_from_alpha(alpha) * self.wing_area)
     
     def toString(self):
-        logging.info(f"{self.get_velocity()} speed (feet per second)")
-        logging.info(f"{self.get_alpha()} alpha (degrees)")
-        logging.info(f"{self.get_wing_area()} wing area (ft^2)")
-        logging.info(f"{self.get_dynamic_pressure()} dynamic pressure (unit)")
-        logging.info(f"{self.calculate_lift()} Lift (lbs)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s speed (feet per second)", self.get_velocity())
+            logger.info("%s alpha (degrees)", self.get_alpha())
+            logger.info("%s wing area (ft^2)", self.get_wing_area())
+            logger.info("%s dynamic pressure (unit)", self.get_dynamic_pressure())
+            logger.info("%s Lift (lbs)", self.calculate_lift())
 
 class Plotter():
     def __init__(self):
@@ -98,13 +119,16 @@ class Plotter():
         self.y_sub_data = []
     
     def getPlotData(self, liftObj, number_of_points):
-        for i in range(0, number_of_points):
-            #liftObj.set_wing_area(i)
-            alpha_temp = 15 * (i / number_of_points)
-            liftObj.set_alpha(alpha_temp)
-            liftObj.generate_dynamic_pressure()
-            self.add_plot_data(alpha_temp, liftObj.calculate_lift())
-            self.add_sub_plot_data(i, alpha_temp)
+        # Every angle of attack of the sweep is evaluated in one array call
+        alphas = 15 * (np.arange(number_of_points) / number_of_points)
+        liftObj.generate_dynamic_pressure()
+        lifts = liftObj.calculate_lift(alphas)
+        if number_of_points > 0:
+            liftObj.set_alpha(float(alphas[-1]))
+        self.x_data.extend(alphas.tolist())
+        self.y_data.extend(lifts.tolist())
+        self.x_sub_data.extend(range(number_of_points))
+        self.y_sub_data.extend(alphas.tolist())
     
     def add_plot_data(self, x_data_in, y_data_in):
         self.x_data.append(x_data_in)
@@ -115,7 +139,8 @@ class Plotter():
         self.y_sub_data.append(y_data_in)
 
     
-    def plot_data(self, liftObj_in):
+    def plot_data(self, liftObj_in, filename=None, show=False):
+        plt = get_pyplot(interactive=show)
         plt.figure(1)
         plt.subplot(211)
         plt.plot(self.x_data, self.y_data)
@@ -127,7 +152,7 @@ class Plotter():
         plt.plot(self.x_sub_data, self.y_sub_data)
         plt.xlabel('wing area (ft^2)')
         plt.ylabel('alpha (deg)')
-        plt.show()
+        finish_figure(plt, filename, show)
     
 
 # 24in x 6in
@@ -139,23 +164,26 @@ class Plotter():
 
 # velocity, density, wing_area, alpha
 if __name__ == "__main__":
+    # Configure logging to log everything (DEBUG level and above) and write to a file
+    configure_logging('log.txt', logging.DEBUG)
+    logger.info("Starting Lift_Calculator script v%s", __version__)
 
-    logging.info("------ Run 1 ------")
+    logger.info("------ Run 1 ------")
     liftObj = Lift(32, 0.00237, 0.667, 0) # Imperial units (fps, slug/ft^3, ft^2, degrees)
     liftObj.generate_dynamic_pressure()
     liftObj.toString()
 
     
     
-    logging.info("\n------ Run 2 ------")
+    logger.info("\n------ Run 2 ------")
 
     liftObj.set_alpha(10)
     liftObj.generate_dynamic_pressure()
-    logging.info(liftObj.find_cl_from_alpha())
+    logger.info(liftObj.find_cl_from_alpha())
     liftObj.toString()
 
-    logging.info("\n------ Plot ------")
+    logger.info("\n------ Plot ------")
 
     pl = Plotter()
     pl.getPlotData(liftObj, 75)
-    pl.plot_data(liftObj)
\ No newline at end of file
+    pl.plot_data(liftObj, show=True)
\ No newline at end of file
@@ -0,0 +1,218 @@
+# Lifting_Line.py
+# Prandtl lifting-line solver (Glauert's Fourier series solution of the monoplane
+# equation) for a straight tapered wing.
+#
+# The circulation is Gamma(theta) = 2 * b * V * sum(A_n * sin(n * theta)) with only
+# odd n for a symmetric wing, and the spanwise stations are y = -b/2 * cos(theta).
+# Enforcing the monoplane equation at the stations gives one dense linear system
+# whose matrix depends only on the planform and the section lift slopes, so it is
+# QR factored once per geometry and every angle of attack only needs a product with
+# Q^T and a back substitution.
+
+import time
+import numpy as np
+
+# Number of Fourier terms (and stations on the half span) used by default
+DEFAULT_TERMS = 24
+
+# Angle of attack range (degrees) over which a polar is treated as linear
+LINEAR_ALPHA_RANGE = (-2.0, 6.0)
+
+
+def polar_lift_line(alpha, cl, alpha_range=LINEAR_ALPHA_RANGE):
+    """
+    Straight line fit of a lift polar over its linear range.
+
+    Parameters:
+    alpha (array): Angles of attack (degrees)
+    cl (array): Lift coefficients, one column per station for a 2-D array
+    alpha_range (tuple): Angles of attack (degrees) used for the fit
+
+    Returns:
+    tuple: Lift slope (per radian) and zero-lift angle of attack (degrees)
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    cl = np.asarray(cl, dtype=np.float64)
+    linear = (alpha >= alpha_range[0]) & (alpha <= alpha_range[1])
+    if np.count_nonzero(linear) < 2:
+        raise ValueError(f"Need at least two polar points between {alpha_range[0]} and {alpha_range[1]} degrees")
+    slope, intercept = np.polyfit(alpha[linear], cl[linear], 1)
+    return np.degrees(slope), -intercept / slope
+
+
+class LiftingLine:
+    def __init__(self, span, root_chord, tip_chord, lift_slope=2 * np.pi, zero_lift_alpha=0.0, twist=0.0, n_terms=DEFAULT_TERMS):
+        """
+        Lifting-line model of a symmetric, linearly tapered wing.
+
+        Parameters:
+        span (float): Total wingspan (any length unit, used consistently)
+        root_chord (float): Root chord length
+        tip_chord (float): Tip chord length
+        lift_slope (float or array): Section lift slope (per radian), one value per station or one for the whole wing
+        zero_lift_alpha (float or array): Section zero-lift angle of attack (degrees), per station or for the whole wing
+        twist (float or array): Geometric twist (degrees) per station, or the tip twist for a linear washout
+        n_terms (int): Number of odd Fourier terms, equal to the number of stations on the half span
+        """
+        self.span = span
+        self.root_chord = root_chord
+        self.tip_chord = tip_chord
+        self.n_terms = n_terms
+        self.area = span * (root_chord + tip_chord) / 2
+        self.aspect_ratio = span**2 / self.area
+
+        # Stations from the tip (theta -> 0) to the root (theta = pi/2) and the odd harmonics
+        self.theta = np.arange(1, n_terms + 1) * np.pi / (2 * n_terms)
+        self.n = 2 * np.arange(n_terms) + 1
+        self.y = span / 2 * np.cos(self.theta)
+        self.chord = root_chord + (tip_chord - root_chord) * self.y / (span / 2)
+        self.lift_slope = self._station_values(lift_slope)
+        self.zero_lift_alpha = self._station_values(zero_lift_alpha)
+        twist = np.asarray(twist, dtype=np.float64)
+        self.twist = twist * self.y / (span / 2) if twist.ndim == 0 else self._station_values(twist)
+
+        # Monoplane equation: sum(A_n * sin(n*theta) * (mu*n + sin(theta))) = mu * (alpha - alpha_0) * sin(theta)
+        self.mu = self.chord * self.lift_slope / (4 * span)
+        self.sin_nt = np.sin(np.outer(self.theta, self.n))
+        matrix = self.sin_nt * (np.outer(self.mu, self.n) + np.sin(self.theta)[:, np.newaxis])
+        # Factored once per geometry: matrix = Q R with R upper triangular
+        self.q, self.r = np.linalg.qr(matrix)
+        self.rhs_scale = self.mu * np.sin(self.theta)
+
+    @classmethod
+    def from_polar(cls, span, root_chord, tip_chord, polar, reynolds=None, alpha_range=LINEAR_ALPHA_RANGE, **kwargs):
+        """
+        Lifting line with section properties taken from airfoil polar data.
+
+        Parameters:
+        polar (Polar or PolarTable): Airfoil_Polars polar, or a Reynolds-indexed table
+        reynolds (callable or float): For a PolarTable, the Reynolds number of each station as a
+                                      function of the chord, or one value for the whole wing
+        alpha_range (tuple): Linear range of the polar (degrees)
+        **kwargs: Passed to LiftingLine (twist, n_terms)
+        """
+        if not hasattr(polar, 'reynolds') or np.ndim(polar.reynolds) == 0:
+            lift_slope, zero_lift_alpha = polar_lift_line(polar.alpha, polar.cl, alpha_range)
+            return cls(span, root_chord, tip_chord, lift_slope, zero_lift_alpha, **kwargs)
+
+        # Reynolds-indexed table: fit every station at its own Reynolds number
+        wing = cls(span, root_chord, tip_chord, **kwargs)
+        station_reynolds = reynolds(wing.chord) if callable(reynolds) else np.full(wing.n_terms, reynolds, dtype=np.float64)
+        cl = polar.cl_at(polar.alpha[:, np.newaxis], station_reynolds[np.newaxis, :])
+        lift_slope, zero_lift_alpha = polar_lift_line(polar.alpha, cl, alpha_range)
+        return cls(span, root_chord, tip_chord, lift_slope, zero_lift_alpha, **kwargs)
+
+    def _solve_factored(self, rhs):
+        # Solution of matrix @ A = rhs from the QR factors, rhs with one column per right-hand side
+        y = self.q.T @ rhs
+        A = np.empty_like(y)
+        for i in range(self.n_terms - 1, -1, -1):  # Back substitution, all right-hand sides at once
+            A[i] = (y[i] - self.r[i, i + 1:] @ A[i + 1:]) / self.r[i, i]
+        return A
+
+    def _station_values(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        return np.full(self.n_terms, float(values)) if values.ndim == 0 else values.reshape(self.n_terms)
+
+    def coefficients(self, alpha):
+        # Fourier coefficients A_n for a wing angle of attack alpha (degrees)
+        effective_alpha = np.radians(alpha + self.twist - self.zero_lift_alpha)
+        return self._solve_factored(self.rhs_scale * effective_alpha)
+
+    def solve(self, alpha, velocity=None, rho=None):
+        """
+        Spanwise loading and wing coefficients at one angle of attack.
+
+        Parameters:
+        alpha (float): Wing (root) angle of attack (degrees)
+        velocity, rho (float): Optional flight condition for the dimensional lift per unit span
+
+        Returns:
+        dict: 'CL', 'CDi', 'span_efficiency', and per station from tip to root 'y',
+              'chord', 'cl' (local section lift coefficient), 'circulation' (Gamma / V)
+              and, when velocity and rho are given, 'lift' (lift per unit span)
+        """
+        A = self.coefficients(alpha)
+        induced = np.sum(self.n * A**2)
+        circulation = 2 * self.span * (self.sin_nt @ A)
+        result = {
+            'CL': np.pi * self.aspect_ratio * A[0],
+            'CDi': np.pi * self.aspect_ratio * induced,
+            'span_efficiency': A[0]**2 / induced if induced > 0 else 1.0,
+            'y': self.y,
+            'chord': self.chord,
+            'cl': 2 * circulation / self.chord,
+            'circulation': circulation,
+        }
+        if velocity is not None and rho is not None:
+            result['lift'] = rho * velocity**2 * circulation
+        return result
+
+    def sweep(self, alphas, velocity=None, rho=None):
+        """
+        Solve every angle of attack of a sweep at once. The right-hand sides of all
+        alphas form one matrix that goes through the QR factors in a single product
+        with Q^T and one back substitution.
+
+        Parameters:
+        alphas (array): Wing (root) angles of attack (degrees)
+        velocity, rho (float): Optional flight condition for the dimensional lift per unit span
+
+        Returns:
+        dict: 'alpha', 'CL', 'CDi', 'span_efficiency' with one value per alpha,
+              'y' and 'chord' per station, and 'cl', 'circulation' (and 'lift')
+              as (alphas x stations) arrays
+        """
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        effective_alpha = np.radians(alphas[np.newaxis, :] + (self.twist - self.zero_lift_alpha)[:, np.newaxis])
+        A = self._solve_factored(self.rhs_scale[:, np.newaxis] * effective_alpha)  # (terms x alphas)
+        induced = self.n @ A**2
+        circulation = 2 * self.span * (self.sin_nt @ A).T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            span_efficiency = np.where(induced > 0, A[0]**2 / induced, 1.0)
+        result = {
+            'alpha': alphas,
+            'CL': np.pi * self.aspect_ratio * A[0],
+            'CDi': np.pi * self.aspect_ratio * induced,
+            'span_efficiency': span_efficiency,
+            'y': self.y,
+            'chord': self.chord,
+            'cl': 2 * circulation / self.chord,
+            'circulation': circulation,
+        }
+        if velocity is not None and rho is not None:
+            result['lift'] = rho * velocity**2 * circulation
+        return result
+
+
+def sweep_benchmark(span=4.572, root_chord=0.9144, tip_chord=0.3048, counts=(1, 10, 100, 1000, 10000), repeats=3):
+    """
+    Time an alpha sweep three ways for growing numbers of alphas and print the table:
+    LiftingLine.sweep (factor once, one multi-right-hand-side solve), one solve()
+    per alpha on the factored system, and rebuilding and solving the system per
+    alpha as a per-alpha solver would.
+
+    Returns:
+    list: (number of alphas, sweep time, solve loop time, rebuild loop time) in seconds
+    """
+    rows = []
+    print(f"{'alphas':>8} {'sweep (ms)':>12} {'solve loop (ms)':>16} {'rebuild loop (ms)':>18}")
+    for count in counts:
+        alphas = np.linspace(-4.0, 12.0, count)
+        sweep_time = min(_timed(lambda: LiftingLine(span, root_chord, tip_chord).sweep(alphas)) for _ in range(repeats))
+        wing = LiftingLine(span, root_chord, tip_chord)
+        loop_time = min(_timed(lambda: [wing.solve(alpha) for alpha in alphas]) for _ in range(repeats))
+        rebuild_time = _timed(lambda: [LiftingLine(span, root_chord, tip_chord).solve(alpha) for alpha in alphas])
+        rows.append((count, sweep_time, loop_time, rebuild_time))
+        print(f"{count:>8} {sweep_time * 1e3:>12.3f} {loop_time * 1e3:>16.3f} {rebuild_time * 1e3:>18.3f}")
+    return rows
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    sweep_benchmark()
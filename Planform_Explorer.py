@@ -0,0 +1,252 @@
+# Planform_Explorer.py
+# Design-space exploration of straight tapered wing planforms.
+#
+# Every combination of span, root chord, tip chord, dihedral and sweep in the given
+# ranges is a candidate. A candidate's aerodynamics come from the lifting-line model
+# (maximum L/D over an alpha sweep with an assumed profile drag), and its structure
+# from the elliptical lift distribution at that lift coefficient: the spar is sized
+# station by station and its volume, plus the skin, gives a weight proxy.
+# Candidates are evaluated in a process pool and every result is appended to a
+# JSON-lines checkpoint as soon as it is done, so an interrupted run resumes with
+# only the missing candidates. The first line of the checkpoint records the flight
+# condition and model constants of the run, and a checkpoint written with different
+# settings is refused instead of resumed. The result is a Pareto table of weight proxy vs L/D.
+#
+# Dihedral and sweep enter the models approximately: sweep reduces the section lift
+# slope by cos(sweep) (simple sweep theory) and lengthens the spar, whose bending
+# moments grow by 1/cos(sweep); dihedral tilts the lift, scaling CL by cos(dihedral)^2
+# (vertical component of a lift acting at a reduced effective angle) and lengthening
+# the spar by 1/cos(dihedral).
+
+import itertools
+import json
+import logging
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from Aero_Logging import configure_logging
+from Lifting_Line import LiftingLine
+from Prandtl_Elliptical_Lift_Distribution import SAFETY_FACTOR, EllipticalLiftDistribution, trapezoid
+
+logger = logging.getLogger(__name__)
+
+Planform = namedtuple('Planform', ['span', 'root_chord', 'tip_chord', 'dihedral', 'sweep'])
+
+# Ranges of the exploration: (lower, upper, number of values). Lengths in inches, angles in degrees
+DEFAULT_RANGES = {
+    'span': (120.0, 200.0, 5),
+    'root_chord': (24.0, 42.0, 4),
+    'tip_chord': (8.0, 24.0, 3),
+    'dihedral': (0.0, 6.0, 2),
+    'sweep': (0.0, 10.0, 2),
+}
+
+# Flight condition of the structural loads (ft/s and slugs/ft^3, as in Prandtl_Elliptical_Lift_Distribution)
+VELOCITY = 38.0
+RHO = 0.0023769
+
+# Profile drag coefficient added to the induced drag of the lifting line
+PROFILE_DRAG = 0.012
+
+# Alphas (degrees) searched for the maximum L/D
+ALPHA_SWEEP = np.linspace(-2.0, 12.0, 57)
+
+# Spar material: yield strength (psi) and density (lb/in^3), and skin weight per wetted area (lb/in^2)
+YIELD_STRENGTH = 12742
+SPAR_DENSITY = 0.0231
+SKIN_AREAL_WEIGHT = 1.5e-4
+
+# Spar wall thicknesses (in), top/bottom and sides, as in size_spar_sections
+SPAR_WALLS = (0.25, 0.125)
+
+# Spanwise stations on the half span for the structural model
+STATIONS = 41
+
+CHECKPOINT_FILE = 'planform_checkpoint.jsonl'
+
+
+def candidate_grid(ranges=DEFAULT_RANGES):
+    """
+    Every planform of the ranges, skipping tip chords larger than the root chord.
+
+    Parameters:
+    ranges (dict): (lower, upper, count) for each Planform field
+
+    Returns:
+    list: Planform candidates
+    """
+    values = [np.linspace(*ranges[field]) for field in Planform._fields]
+    return [Planform(*map(float, combination)) for combination in itertools.product(*values)
+            if combination[2] <= combination[1]]
+
+
+def candidate_key(planform):
+    # Stable identifier of a candidate in the checkpoint
+    return json.dumps([round(value, 9) for value in planform])
+
+
+def evaluate_candidate(planform, velocity=VELOCITY, rho=RHO, profile_drag=PROFILE_DRAG):
+    """
+    Aerodynamics and structural weight proxy of one planform.
+
+    Parameters:
+    planform (Planform): Span, root and tip chord (in), dihedral and sweep (degrees)
+    velocity (float): Flight velocity (ft/s)
+    rho (float): Air density (slugs/ft^3)
+    profile_drag (float): Profile drag coefficient
+
+    Returns:
+    dict: The planform fields, 'area', 'aspect_ratio', 'alpha' and 'CL' at maximum L/D,
+          'L_over_D', 'root_moment' (lb-in), 'spar_height' at the root (in) and 'weight' (lb)
+    """
+    cos_sweep = np.cos(np.radians(planform.sweep))
+    cos_dihedral = np.cos(np.radians(planform.dihedral))
+
+    # Aerodynamics: best L/D of the alpha sweep
+    wing = LiftingLine(planform.span, planform.root_chord, planform.tip_chord, lift_slope=2 * np.pi * cos_sweep)
+    sweep = wing.sweep(ALPHA_SWEEP)
+    CL = sweep['CL'] * cos_dihedral**2
+    L_over_D = CL / (profile_drag + sweep['CDi'])
+    best = int(np.argmax(L_over_D))
+
+    # Structure: spar sized for the elliptical distribution at the best lift coefficient. Only the
+    # calculation methods are used, which neither log nor create the output folder
+    distribution = EllipticalLiftDistribution(planform.span, CL[best], rho, velocity, planform.root_chord, planform.tip_chord)
+    positions = np.linspace(0, planform.span / 2, STATIONS)
+    moments = distribution.calculate_distributions_array(positions)['moment'] / cos_sweep
+    heights, widths, _ = distribution.size_spar_sections(moments, YIELD_STRENGTH, top_bottom_thickness=SPAR_WALLS[0], side_thickness=SPAR_WALLS[1])
+    section_area = heights * widths - (heights - 2 * SPAR_WALLS[0]) * (widths - 2 * SPAR_WALLS[1])
+    spar_length_scale = 1 / (cos_sweep * cos_dihedral)
+    spar_weight = 2 * SPAR_DENSITY * trapezoid(section_area, positions) * spar_length_scale
+    skin_weight = 2 * SKIN_AREAL_WEIGHT * wing.area * spar_length_scale
+
+    return dict(planform._asdict(), **{
+        'area': wing.area,
+        'aspect_ratio': wing.aspect_ratio,
+        'alpha': float(ALPHA_SWEEP[best]),
+        'CL': float(CL[best]),
+        'L_over_D': float(L_over_D[best]),
+        'root_moment': float(moments[0]),
+        'spar_height': float(heights[0]),
+        'weight': float(spar_weight + skin_weight),
+    })
+
+
+def checkpoint_settings(velocity=VELOCITY, rho=RHO, profile_drag=PROFILE_DRAG):
+    # Everything besides the planform that determines a result, as stored in the checkpoint header
+    settings = {
+        'velocity': velocity,
+        'rho': rho,
+        'profile_drag': profile_drag,
+        'alpha_sweep': ALPHA_SWEEP,
+        'yield_strength': YIELD_STRENGTH,
+        'spar_density': SPAR_DENSITY,
+        'spar_walls': SPAR_WALLS,
+        'skin_areal_weight': SKIN_AREAL_WEIGHT,
+        'stations': STATIONS,
+        'safety_factor': SAFETY_FACTOR,
+    }
+    # Round trip through JSON so the settings compare equal to the ones read back from a checkpoint
+    return json.loads(json.dumps(settings, default=lambda value: np.asarray(value).tolist()))
+
+
+def read_checkpoint(path):
+    """
+    Header settings and finished results of a checkpoint. A line cut short by an
+    interruption is ignored.
+
+    Returns:
+    tuple: Settings of the run that wrote the checkpoint (None for a new or empty
+           file) and the finished results by candidate key
+    """
+    settings = None
+    results = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if 'settings' in record:
+                    settings = record['settings']
+                else:
+                    results[record['key']] = record['result']
+    return settings, results
+
+
+def explore(candidates, checkpoint=CHECKPOINT_FILE, max_workers=None, velocity=VELOCITY, rho=RHO, profile_drag=PROFILE_DRAG):
+    """
+    Evaluate the candidates in a process pool, resuming from the checkpoint.
+
+    Parameters:
+    candidates (list): Planform candidates
+    checkpoint (str): JSON-lines file with a settings header and one finished candidate per line
+    max_workers (int): Number of processes, 1 evaluates in this process
+    velocity, rho, profile_drag (float): Flight condition and profile drag, see evaluate_candidate
+
+    Returns:
+    list: Results of every candidate, in the order of candidates
+
+    Raises:
+    ValueError: The checkpoint was written with a different flight condition or model constants
+    """
+    conditions = {'velocity': velocity, 'rho': rho, 'profile_drag': profile_drag}
+    settings = checkpoint_settings(**conditions)
+    stored_settings, finished = read_checkpoint(checkpoint)
+    if (stored_settings is not None or finished) and stored_settings != settings:
+        raise ValueError(f"Checkpoint {checkpoint} was written with settings {stored_settings}, not {settings}; "
+                         "use another checkpoint file or remove it to start over")
+    pending = [planform for planform in candidates if candidate_key(planform) not in finished]
+    logger.info("%d candidates, %d in the checkpoint, %d to evaluate", len(candidates), len(candidates) - len(pending), len(pending))
+
+    with open(checkpoint, 'a+') as f:
+        # Terminate a line cut short by an interruption before appending
+        if f.tell() > 0:
+            f.seek(f.tell() - 1)
+            if f.read(1) != '\n':
+                f.write('\n')
+        if stored_settings is None:
+            f.write(json.dumps({'settings': settings}) + '\n')
+
+        def record(planform, result):
+            # One flushed line per candidate, so an interruption loses at most the running ones
+            key = candidate_key(planform)
+            finished[key] = result
+            f.write(json.dumps({'key': key, 'result': result}) + '\n')
+            f.flush()
+
+        if max_workers == 1 or len(pending) < 2:
+            for planform in pending:
+                record(planform, evaluate_candidate(planform, **conditions))
+        elif pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(evaluate_candidate, planform, **conditions): planform for planform in pending}
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+
+    return [finished[candidate_key(planform)] for planform in candidates]
+
+
+def pareto_front(results):
+    # Results not beaten by a lighter (or equally heavy) candidate with a higher L/D, lightest first
+    front = []
+    for result in sorted(results, key=lambda r: (r['weight'], -r['L_over_D'])):
+        if not front or result['L_over_D'] > front[-1]['L_over_D']:
+            front.append(result)
+    return front
+
+
+def pareto_table(front):
+    lines = [f"{'weight (lb)':>12} {'L/D':>8} {'span':>8} {'root c':>8} {'tip c':>8} {'dihedral':>9} {'sweep':>7} {'AR':>6} {'CL':>6}"]
+    for r in front:
+        lines.append(f"{r['weight']:>12.3f} {r['L_over_D']:>8.3f} {r['span']:>8.2f} {r['root_chord']:>8.2f} {r['tip_chord']:>8.2f} "
+                     f"{r['dihedral']:>9.2f} {r['sweep']:>7.2f} {r['aspect_ratio']:>6.2f} {r['CL']:>6.3f}")
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    configure_logging('Planform_Explorer_log.txt', logging.INFO)
+    results = explore(candidate_grid())
+    print(pareto_table(pareto_front(results)))
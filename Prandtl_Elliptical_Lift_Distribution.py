@@ -1,7 +1,54 @@
 import os
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
+from Aero_Logging import log_stations, start_async_logging
+from Aero_Plotting import finish_figure, get_pyplot, render_batch
+
+logger = logging.getLogger(__name__)
+
+# Safety factor applied to the structural loads
+SAFETY_FACTOR = 1.3
+
+# Fields of the structured arrays returned by calculate_distributions_array
+DISTRIBUTION_DTYPE = np.dtype([
+    ('position', np.float64),
+    ('lift', np.float64),
+    ('chord', np.float64),
+    ('load', np.float64),
+    ('shear', np.float64),
+    ('moment', np.float64),
+    ('torsion', np.float64),
+])
+
+# Figures drawn by plot_distributions: (field, ylabel, title, filename, color)
+DISTRIBUTION_PLOTS = [
+    ('lift', 'Lift per Unit Span (lb/in)', 'Elliptical Lift Distribution', 'lift_distribution.png', 'Indigo'),
+    ('load', 'Load (lb)', 'Load Distribution', 'load_distribution.png', 'Orange'),
+    ('shear', 'Shear Force (lb)', 'Shear Force Distribution', 'shear_force_distribution.png', 'Red'),
+    ('moment', 'Bending Moment (lb-in)', 'Bending Moment Distribution', 'bending_moment_distribution.png', 'Green'),
+]
+
+# np.trapz was renamed np.trapezoid in NumPy 2
+trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+# Calculate the section modulus for a hollow rectangular cross-section
+def section_modulus(h, b, top_bottom_thickness, side_thickness):
+    inner_height = h - 2 * top_bottom_thickness
+    inner_width = b - 2 * side_thickness
+    return (b * h**2 - inner_width * inner_height**2) / 6
+
+def plot_station_values(positions, values, ylabel, title, path, color='b', fontweight='normal', show=False):
+    # Draw one spanwise distribution and save it to path. Module level so render_batch can run it in worker processes
+    plt = get_pyplot(interactive=show)
+    plt.figure(figsize=(10, 6))
+    plt.plot(positions, values, '-o', label=title.split('\n')[0], color=color)
+    plt.xlabel('Spanwise Position (in)')
+    plt.ylabel(ylabel)
+    plt.title(title, fontweight=fontweight)
+    plt.legend()
+    plt.grid(True)
+    finish_figure(plt, path, show)
+    return path
 
 class EllipticalLiftDistribution:
     def __init__(self, span, lift_coefficient, rho, velocity, root_chord, tip_chord, output_folder='Wing_Loading', design_load=3.52):
@@ -11,16 +58,12 @@ class EllipticalLiftDistribution:
         self.velocity = velocity
         self.root_chord = root_chord
         self.tip_chord = tip_chord
-        self.output_folder = output_folder
+        self.output_folder = output_folder  # Created when the first figure is saved
         self.design_load = design_load
-        os.makedirs(self.output_folder, exist_ok=True)
-        logging.info(f"Parameters: span={span} in, lift_coefficient={lift_coefficient}, rho={rho}, velocity={velocity} ft/s, root_chord={root_chord} in, tip_chord={tip_chord} in")
 
     def lift_at_position(self, y_position):
-        b = self.span / 2  # Semi-span
-        taper_ratio = self.tip_chord / self.root_chord
-        chord_length = self.root_chord * (1 - (1 - taper_ratio) * y_position / b)  # Linear taper
-        lift = (4 * self.lift_coefficient * self.rho * self.velocity**2 * chord_length) / (np.pi * self.span) * np.sqrt(1 - (y_position / b)**2)
+        unit_lift, chord_length = self.unit_lift_at_position(y_position)
+        lift = self.lift_coefficient * self.rho * self.velocity**2 * unit_lift
         return lift, chord_length  # Return lift in lb/in
 
     def calculate_distributions(self, positions):
@@ -31,9 +74,7 @@ class EllipticalLiftDistribution:
         for i in range(len(positions) - 1):
             delta_pos = positions[i + 1] - positions[i]
             loads[i] = lifts_and_chords[i][0] * delta_pos
-            logging.info(f"Position {positions[i]:.2f} in, Lift {lifts_and_chords[i][0]:.2f} lb/in, Delta Pos {delta_pos:.2f} in, Load {loads[i]:.2f} lb")
         loads[-1] = lifts_and_chords[-1][0] * (positions[-1] - positions[-2])
-        logging.info(f"Position {positions[-1]:.2f} in, Lift {lifts_and_chords[-1][0]:.2f} lb/in, Delta Pos {positions[-1] - positions[-2]:.2f} in, Load {loads[-1]:.2f} lb")
 
         shear_forces = np.zeros(len(positions))
         for i in range(len(positions) - 1, -1, -1):
@@ -41,7 +82,6 @@ class EllipticalLiftDistribution:
                 shear_forces[i] = 0  # Shear force at the wing tip is zero
             else:
                 shear_forces[i] = shear_forces[i + 1] + loads[i]
-            logging.info(f"Position {positions[i]:.2f} in, Shear Force {shear_forces[i]:.2f} lb")
 
         bending_moments = np.zeros(len(positions))
         for i in range(len(positions) - 1, -1, -1):
@@ -50,101 +90,281 @@ class EllipticalLiftDistribution:
             else:
                 delta_pos = positions[i + 1] - positions[i]
                 bending_moments[i] = bending_moments[i + 1] + shear_forces[i] * delta_pos
-            logging.info(f"Position {positions[i]:.2f} in, Bending Moment {bending_moments[i]:.2f} lb-in")
 
         # Apply 30% safety factor
-        safety_factor = 1.3
+        safety_factor = SAFETY_FACTOR
         loads *= safety_factor
         shear_forces *= safety_factor
         bending_moments *= safety_factor
 
+        if logger.isEnabledFor(logging.INFO):
+            log_stations(logger, "Load distribution (with safety factor)", position=positions, lift=[lift for lift, _ in lifts_and_chords],
+                         load=loads, shear_force=shear_forces, bending_moment=bending_moments)
+
         return lifts_and_chords, loads, shear_forces, bending_moments
 
-    def plot_distribution(self, positions, values, ylabel, title, filename, figure_num, color='b', fontweight='normal'):
-        plt.figure(num=figure_num, figsize=(10, 6))
-        plt.plot(positions, values, '-o', label=title, color=color)
-        plt.xlabel('Spanwise Position (in)')
-        plt.ylabel(ylabel)
-        plt.title(f"{title}\nVelocity: {self.velocity} ft/s, Lift Coefficient: {self.lift_coefficient}, Air Density: {self.rho} slugs/ft³", fontweight=fontweight)
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(os.path.join(self.output_folder, filename))
-        plt.show()
-        logging.info(f"Plotted and saved the {title.lower()}")
+    def calculate_distributions_array(self, positions, moment_arm_lift_array=None, moment_arm_drag_array=None):
+        """
+        Array version of calculate_distributions and calculate_torsional_load.
+
+        Every spanwise quantity is computed with whole-array operations, which keeps
+        the cost flat in Python when thousands of stations are used.
+
+        Parameters:
+        positions (array): Spanwise positions from root to tip (in)
+        moment_arm_lift_array (array): Lift moment arm per position (in), defaults to the quarter chord
+        moment_arm_drag_array (array): Drag moment arm per position (in), defaults to zero
+
+        Returns:
+        ndarray: Structured array (DISTRIBUTION_DTYPE) with one record per position.
+                 load, shear and moment include the safety factor, exactly as
+                 calculate_distributions; torsion matches calculate_torsional_load.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        lift, chord = self.lift_at_position(positions)
+        torsion = self._torsion(lift, chord, moment_arm_lift_array, moment_arm_drag_array)
+
+        # Zero lift at the wingtip
+        lift[-1] = 0
+        chord[-1] = self.tip_chord
+        loads, shear_forces, bending_moments = self._integrate_stations(positions, lift)
+
+        result = np.empty(len(positions), dtype=DISTRIBUTION_DTYPE)
+        result['position'] = positions
+        result['lift'] = lift
+        result['chord'] = chord
+        result['load'] = loads * SAFETY_FACTOR
+        result['shear'] = shear_forces * SAFETY_FACTOR
+        result['moment'] = bending_moments * SAFETY_FACTOR
+        result['torsion'] = torsion
+        return result
+
+    def calculate_distributions_batch(self, positions, velocity=None, lift_coefficient=None, rho=None, load_factor=1.0, moment_arm_lift_array=None, moment_arm_drag_array=None):
+        """
+        Evaluate many flight conditions on this wing geometry in one vectorized pass.
+
+        velocity, lift_coefficient, rho and load_factor are broadcast against each
+        other (pass np.meshgrid outputs for a full factorial sweep) and flattened
+        into cases. Arguments left as None use the instance value. The lift is
+        linear in lift_coefficient * rho * velocity**2 * load_factor, so the
+        geometry-only distributions are computed once and scaled per case.
+
+        Returns:
+        dict: 'position' and 'chord' per station, the flattened case parameters,
+              and 'lift', 'load', 'shear', 'moment', 'torsion' as
+              (cases x stations) arrays with the same conventions as
+              calculate_distributions_array.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        velocity = self.velocity if velocity is None else velocity
+        lift_coefficient = self.lift_coefficient if lift_coefficient is None else lift_coefficient
+        rho = self.rho if rho is None else rho
+        velocity, lift_coefficient, rho, load_factor = (np.ravel(a).astype(np.float64) for a in np.broadcast_arrays(velocity, lift_coefficient, rho, load_factor))
+        scale = (lift_coefficient * rho * velocity**2 * load_factor)[:, np.newaxis]
+
+        # Distributions for lift_coefficient * rho * velocity**2 * load_factor = 1
+        unit_lift, chord = self.unit_lift_at_position(positions)
+        unit_torsion = self._torsion(unit_lift, chord, moment_arm_lift_array, moment_arm_drag_array)
+        unit_lift[-1] = 0
+        chord[-1] = self.tip_chord
+        unit_loads, unit_shear, unit_moments = self._integrate_stations(positions, unit_lift)
+
+        return {
+            'position': positions,
+            'chord': chord,
+            'velocity': velocity,
+            'lift_coefficient': lift_coefficient,
+            'rho': rho,
+            'load_factor': load_factor,
+            'lift': scale * unit_lift,
+            'load': scale * (unit_loads * SAFETY_FACTOR),
+            'shear': scale * (unit_shear * SAFETY_FACTOR),
+            'moment': scale * (unit_moments * SAFETY_FACTOR),
+            'torsion': scale * unit_torsion,
+        }
+
+    def unit_lift_at_position(self, y_position):
+        # Lift per unit span for lift_coefficient * rho * velocity**2 = 1
+        b = self.span / 2  # Semi-span
+        taper_ratio = self.tip_chord / self.root_chord
+        chord_length = self.root_chord * (1 - (1 - taper_ratio) * y_position / b)  # Linear taper
+        lift = (4 * chord_length) / (np.pi * self.span) * np.sqrt(1 - (y_position / b)**2)
+        return lift, chord_length
+
+    @staticmethod
+    def _torsion(lift, chord, moment_arm_lift_array, moment_arm_drag_array):
+        if moment_arm_lift_array is None:
+            moment_arm_lift_array = 0.25 * chord
+        if moment_arm_drag_array is None:
+            moment_arm_drag_array = np.zeros_like(chord)
+        drag = 0.1 * lift  # Assuming drag is 10% of lift for simplicity
+        return lift * np.asarray(moment_arm_lift_array) + drag * np.asarray(moment_arm_drag_array)
+
+    @staticmethod
+    def _integrate_stations(positions, lift):
+        # Loads, shear forces and bending moments (without safety factor) from the lift per unit span
+        delta_pos = np.diff(positions)
+        loads = np.empty_like(positions)
+        loads[:-1] = lift[:-1] * delta_pos
+        loads[-1] = lift[-1] * delta_pos[-1]
+
+        # Shear and bending moment are zero at the tip and accumulate towards the root
+        shear_forces = np.zeros_like(positions)
+        shear_forces[:-1] = np.cumsum(loads[-2::-1])[::-1]
+        bending_moments = np.zeros_like(positions)
+        bending_moments[:-1] = np.cumsum((shear_forces[:-1] * delta_pos)[::-1])[::-1]
+        return loads, shear_forces, bending_moments
+
+    def _plot_title(self, title, velocity=None, lift_coefficient=None, rho=None):
+        velocity = self.velocity if velocity is None else velocity
+        lift_coefficient = self.lift_coefficient if lift_coefficient is None else lift_coefficient
+        rho = self.rho if rho is None else rho
+        return f"{title}\nVelocity: {velocity} ft/s, Lift Coefficient: {lift_coefficient}, Air Density: {rho} slugs/ft³"
+
+    def _output_path(self, filename):
+        # Path in the output folder, which is only created once something is written to it
+        os.makedirs(self.output_folder, exist_ok=True)
+        return os.path.join(self.output_folder, filename)
+
+    def plot_distribution(self, positions, values, ylabel, title, filename, figure_num=None, color='b', fontweight='normal', show=False):
+        # Saves the figure to the output folder; it is only displayed when show is True
+        plot_station_values(positions, values, ylabel, self._plot_title(title), self._output_path(filename), color, fontweight, show)
+        logger.info("Plotted and saved the %s", title.lower())
+
+    def plot_distributions(self, distributions, prefix='', show=False):
+        # Lift, load, shear and moment figures of a calculate_distributions_array result
+        for field, ylabel, title, filename, color in DISTRIBUTION_PLOTS:
+            self.plot_distribution(distributions['position'], distributions[field], ylabel, title, prefix + filename, color=color, show=show)
+
+    def render_batch(self, batch, prefix='case', max_workers=None):
+        """
+        Render the figures of every case of a calculate_distributions_batch result
+        in a process pool with the headless backend. Files are written to the
+        output folder as <prefix>_<case>_<figure>.png.
+
+        Returns:
+        list: Paths of the written figures
+        """
+        jobs = []
+        for i in range(len(batch['velocity'])):
+            title_values = (batch['velocity'][i], batch['lift_coefficient'][i], batch['rho'][i])
+            for field, ylabel, title, filename, color in DISTRIBUTION_PLOTS:
+                path = self._output_path(f"{prefix}_{i}_{filename}")
+                jobs.append((batch['position'], batch[field][i], ylabel, self._plot_title(title, *title_values), path, color))
+        return render_batch(plot_station_values, jobs, max_workers)
+
+    def log_parameters(self):
+        logger.info("Parameters: span=%s in, lift_coefficient=%s, rho=%s, velocity=%s ft/s, root_chord=%s in, tip_chord=%s in",
+                    self.span, self.lift_coefficient, self.rho, self.velocity, self.root_chord, self.tip_chord)
 
     def log_results(self, positions, lifts_chords_loads_shear_moment):
-        for pos, (lift, chord, load, shear_force, bending_moment) in zip(positions, lifts_chords_loads_shear_moment):
-            logging.info(f"Lift per unit span at {pos:.2f} in: {lift:.2f} lb/in, Chord length: {chord:.2f} in, Load: {load:.2f} lb, Shear force: {shear_force:.2f} lb, Bending moment: {bending_moment:.2f} lb-in")
+        if logger.isEnabledFor(logging.INFO):
+            lift, chord, load, shear_force, bending_moment = zip(*lifts_chords_loads_shear_moment)
+            log_stations(logger, "Results per spanwise position (in, lb/in, in, lb, lb, lb-in)", position=positions, lift=lift, chord=chord,
+                         load=load, shear_force=shear_force, bending_moment=bending_moment)
+
+    def store_results(self, store, distributions, case=None):
+        """
+        Append a calculate_distributions_array result to a Result_Store.ResultStore,
+        with the wing and flight condition as case metadata.
+
+        Returns:
+        int: Index of the case in the store
+        """
+        case = case or f"V{self.velocity}_CL{self.lift_coefficient}_rho{self.rho}"
+        return store.append_records(case, distributions, self._store_meta())
+
+    def store_batch(self, store, batch, prefix='case'):
+        """
+        Append every case of a calculate_distributions_batch result to a
+        Result_Store.ResultStore in one bulk write. Cases are named prefix_<n>.
+        The station positions and chords are written once and shared by every case.
+
+        Returns:
+        list: Indices of the cases in the store
+        """
+        cases = []
+        for i in range(len(batch['velocity'])):
+            meta = self._store_meta()
+            meta.update({key: batch[key][i] for key in ('velocity', 'lift_coefficient', 'rho', 'load_factor')})
+            columns = {key: batch[key][i] for key in ('lift', 'load', 'shear', 'moment', 'torsion')}
+            cases.append((f"{prefix}_{i}", meta, columns))
+        return store.append_many(cases, shared={'position': batch['position'], 'chord': batch['chord']})
+
+    def _store_meta(self):
+        return {'span': self.span, 'lift_coefficient': self.lift_coefficient, 'rho': self.rho, 'velocity': self.velocity,
+                'root_chord': self.root_chord, 'tip_chord': self.tip_chord, 'safety_factor': SAFETY_FACTOR}
 
     def size_spar(self, bending_moments, yield_strength):
-        max_bending_moment = max(bending_moments)
+        # Sized on the magnitude, so a download (all moments negative) gives the same spar as the upload
+        max_bending_moment = float(np.max(np.abs(bending_moments)))
         required_section_modulus = max_bending_moment * self.design_load / yield_strength
 
-        # Given specifications
-        top_bottom_thickness = 0.25  # 1/4" spars at the top and bottom
-        side_thickness = 0.125  # 1/8" thick pieces on the sides
-
-        # Initial guess for height and width
-        h = 2.5  # Initial guess for height in inches
-        b = .5  # Initial guess for width in inches
-
-        # Calculate the section modulus for a hollow rectangular cross-section
-        def section_modulus(h, b, top_bottom_thickness, side_thickness):
-            outer_area = b * h
-            inner_height = h - 2 * top_bottom_thickness
-            inner_width = b - 2 * side_thickness
-            inner_area = inner_width * inner_height
-            net_area = outer_area - inner_area
-            return (b * h**2 - inner_width * inner_height**2) / 6
-
-        # Adjust dimensions to meet the required section modulus
-        while section_modulus(h, b, top_bottom_thickness, side_thickness) < required_section_modulus:
-            h += 0.1  # Increment height
-            b += 0.1  # Increment width
+        h, b, max_bending_moment_handled = self.size_spar_sections(max_bending_moment, yield_strength)
+        h, b, max_bending_moment_handled = float(h), float(b), float(max_bending_moment_handled)
 
-        # Calculate the section modulus of the sized spar
-        final_section_modulus = section_modulus(h, b, top_bottom_thickness, side_thickness)
-
-        # Determine the maximum bending moment the spar can handle
-        max_bending_moment_handled = final_section_modulus * yield_strength / self.design_load
-
-        logging.info(f"Max bending moment: {max_bending_moment:.2f} lb-in")
-        logging.info(f"Required section modulus: {required_section_modulus:.2f} in^3")
-        logging.info(f"Spar dimensions: height = {h:.2f} in, width = {b:.2f} in")
-        logging.info(f"Max bending moment the spar can handle: {max_bending_moment_handled:.2f} lb-in")
+        logger.info("Max bending moment: %.2f lb-in", max_bending_moment)
+        logger.info("Required section modulus: %.2f in^3", required_section_modulus)
+        logger.info("Spar dimensions: height = %.2f in, width = %.2f in", h, b)
+        logger.info("Max bending moment the spar can handle: %.2f lb-in", max_bending_moment_handled)
 
         return h, b, max_bending_moment_handled
 
+    def size_spar_sections(self, bending_moments, yield_strength, h=2.5, b=0.5, top_bottom_thickness=0.25, side_thickness=0.125):
+        """
+        Size a hollow rectangular spar section for every bending moment in one pass.
+
+        Height and width grow together from the initial h and b (in) with the wall
+        thicknesses fixed, as in size_spar. The section modulus is then a quadratic
+        in the growth, so the smallest section meeting the required modulus is
+        found directly from the quadratic formula instead of by stepping.
+
+        Parameters:
+        bending_moments (float or array): Bending moment at each station (lb-in). Negative
+                                          (download) moments are sized on their magnitude
+        yield_strength (float): Yield strength of the spar material (psi)
+
+        Returns:
+        tuple: Arrays of spar height (in), width (in) and the bending moment each
+               section can handle (lb-in), shaped like bending_moments.
+        """
+        required_section_modulus = np.abs(np.asarray(bending_moments, dtype=np.float64)) * self.design_load / yield_strength
+
+        # 6 * section_modulus(h + s, b + s) = A s^2 + B s + C
+        c = 2 * side_thickness
+        d = 2 * top_bottom_thickness
+        A = c + 2 * d
+        B = 2 * c * h + 2 * d * (h + b) - 2 * c * d - d**2
+        C = c * h**2 + 2 * d * b * h - 2 * c * d * h - d**2 * b + c * d**2
+
+        # Growth is never negative, the initial section is the smallest allowed
+        growth = (-B + np.sqrt(B**2 - 4 * A * (C - 6 * required_section_modulus))) / (2 * A)
+        growth = np.maximum(growth, 0.0)
+
+        heights = h + growth
+        widths = b + growth
+        max_bending_moments_handled = section_modulus(heights, widths, top_bottom_thickness, side_thickness) * yield_strength / self.design_load
+        return heights, widths, max_bending_moments_handled
+
     def calculate_torsional_load(self, positions, moment_arm_lift_array, moment_arm_drag_array):
-        torques = np.zeros(len(positions))
-        for i, pos in enumerate(positions):
-            lift = self.lift_at_position(pos)[0]
-            drag = 0.1 * lift  # Assuming drag is 10% of lift for simplicity
-            torques[i] = lift * moment_arm_lift_array[i] + drag * moment_arm_drag_array[i]
-            logging.info(f"Position {pos:.2f} in, Lift {lift:.2f} lb, Drag {drag:.2f} lb, Torque {torques[i]:.2f} lb-in")
+        lift = self.lift_at_position(np.asarray(positions, dtype=np.float64))[0]
+        drag = 0.1 * lift  # Assuming drag is 10% of lift for simplicity
+        torques = lift * np.asarray(moment_arm_lift_array) + drag * np.asarray(moment_arm_drag_array)
+        log_stations(logger, "Torsional load distribution", position=positions, lift=lift, drag=drag, torque=torques)
 
         # Integrate the torque along the span to get the total torsional load
-        total_torsional_load = np.trapz(torques, positions)
-        logging.info(f"Total Torsional Load: {total_torsional_load:.2f} lb-in")
+        total_torsional_load = trapezoid(torques, positions)
+        logger.info("Total Torsional Load: %.2f lb-in", total_torsional_load)
         return torques, total_torsional_load
 
-    def plot_torsional_load(self, positions, torques, filename='torsional_load.png'):
-        plt.figure(figsize=(10, 6))
-        plt.plot(positions, torques, '-o', label='Torsional Load', color='Purple')
-        plt.xlabel('Spanwise Position (in)')
-        plt.ylabel('Torque (lb-in)')
-        plt.title('Torsional Load Distribution')
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(os.path.join(self.output_folder, filename))
-        plt.show()
-        logging.info(f"Plotted and saved the torsional load distribution")
+    def plot_torsional_load(self, positions, torques, filename='torsional_load.png', show=False):
+        plot_station_values(positions, torques, 'Torque (lb-in)', 'Torsional Load Distribution', self._output_path(filename), 'Purple', show=show)
+        logger.info("Plotted and saved the torsional load distribution")
 
 # Example usage
 if __name__ == "__main__":
     # Configure logging
-    logging.basicConfig(filename='Wing_Loading_Log.log', level=logging.INFO, 
-                        format='%(asctime)s - %(levelname)s - %(message)s')
+    start_async_logging('Wing_Loading_Log.log', logging.INFO)
 
     # Define parameters in imperial units (inches)
     span = 15 * 12  # Total wingspan in inches
@@ -159,37 +379,36 @@ if __name__ == "__main__":
 
     # Create an instance of the class
     distribution = EllipticalLiftDistribution(span, lift_coefficient, rho, velocity, root_chord, tip_chord)
+    distribution.log_parameters()
 
-# Generate uniform positions in inches
-num_positions = 22  # Number of positions to calculate
-positions = np.linspace(0, span / 2, num_positions)  # Uniformly spaced positions from root to tip
-
-# Calculate distributions
-lifts_and_chords, loads, shear_forces, bending_moments = distribution.calculate_distributions(positions)
+    # Generate uniform positions in inches
+    num_positions = 22  # Number of positions to calculate
+    positions = np.linspace(0, span / 2, num_positions)  # Uniformly spaced positions from root to tip
 
-# Combine lift, chord, load, shear force, and bending moment into a single list
-lifts_chords_loads_shear_moment = [(lift, chord, load, shear_force, bending_moment) for (lift, chord), load, shear_force, bending_moment in zip(lifts_and_chords, loads, shear_forces, bending_moments)]
+    # Calculate distributions
+    lifts_and_chords, loads, shear_forces, bending_moments = distribution.calculate_distributions(positions)
 
-# Plot distributions
-distribution.plot_distribution(positions, [lift for lift, _, _, _, _ in lifts_chords_loads_shear_moment], 'Lift per Unit Span (lb/in)', 'Elliptical Lift Distribution', 'lift_distribution.png', figure_num=1, color='Indigo')
-distribution.plot_distribution(positions, loads, 'Load (lb)', 'Load Distribution', 'load_distribution.png', figure_num=2, color='Orange')
-distribution.plot_distribution(positions, shear_forces, 'Shear Force (lb)', 'Shear Force Distribution', 'shear_force_distribution.png', figure_num=3, color='Red')
-distribution.plot_distribution(positions, bending_moments, 'Bending Moment (lb-in)', 'Bending Moment Distribution', 'bending_moment_distribution.png', figure_num=4, color='Green')
+    # Combine lift, chord, load, shear force, and bending moment into a single list
+    lifts_chords_loads_shear_moment = [(lift, chord, load, shear_force, bending_moment) for (lift, chord), load, shear_force, bending_moment in zip(lifts_and_chords, loads, shear_forces, bending_moments)]
 
-# Log results
-distribution.log_results(positions, lifts_chords_loads_shear_moment)
+    # Log results
+    distribution.log_results(positions, lifts_chords_loads_shear_moment)
 
-# Save log to picture
-# distribution.save_log_to_picture(log_filename='Wing_Loading_Log.log', output_filename='Wing_Loading_log.png')
+    # Save log to picture
+    # distribution.save_log_to_picture(log_filename='Wing_Loading_Log.log', output_filename='Wing_Loading_log.png')
 
-# Size the spar
-yield_strength = 12742  # Example yield strength in psi
-spar_height, spar_width, max_bending_moment_handled = distribution.size_spar(bending_moments, yield_strength)
+    # Size the spar
+    yield_strength = 12742  # Example yield strength in psi
+    spar_height, spar_width, max_bending_moment_handled = distribution.size_spar(bending_moments, yield_strength)
 
-# Calculate torsional load
-moment_arm_lift_array = np.linspace(7.64, 6.48, num_positions)  # Example varying moment arm for lift in inches
-moment_arm_drag_array = np.linspace(0, 0, num_positions)  # Example varying moment arm for drag in inches
-torques, total_torsional_load = distribution.calculate_torsional_load(positions, moment_arm_lift_array, moment_arm_drag_array)
+    # Calculate torsional load
+    moment_arm_lift_array = np.linspace(7.64, 6.48, num_positions)  # Example varying moment arm for lift in inches
+    moment_arm_drag_array = np.linspace(0, 0, num_positions)  # Example varying moment arm for drag in inches
+    torques, total_torsional_load = distribution.calculate_torsional_load(positions, moment_arm_lift_array, moment_arm_drag_array)
 
-# Plot torsional load distribution
-distribution.plot_torsional_load(positions, torques)
\ No newline at end of file
+    # Plot the distributions once everything is computed (saved to the output folder, set show=True for windows)
+    distribution.plot_distribution(positions, [lift for lift, _, _, _, _ in lifts_chords_loads_shear_moment], 'Lift per Unit Span (lb/in)', 'Elliptical Lift Distribution', 'lift_distribution.png', color='Indigo')
+    distribution.plot_distribution(positions, loads, 'Load (lb)', 'Load Distribution', 'load_distribution.png', color='Orange')
+    distribution.plot_distribution(positions, shear_forces, 'Shear Force (lb)', 'Shear Force Distribution', 'shear_force_distribution.png', color='Red')
+    distribution.plot_distribution(positions, bending_moments, 'Bending Moment (lb-in)', 'Bending Moment Distribution', 'bending_moment_distribution.png', color='Green')
+    distribution.plot_torsional_load(positions, torques)
\ No newline at end of file
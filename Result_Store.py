@@ -0,0 +1,173 @@
+# Result_Store.py
+# Columnar binary store for spanwise results (position, lift, chord, load, shear,
+# moment, torsion, stiffness, ...) of many cases.
+#
+# A store is a folder with one raw little-endian float64 file per column and an
+# index.jsonl file with one line per case giving the case name, its metadata and
+# the (offset, length) of each of its columns. Cases are only ever appended, so
+# writing a case is a few bulk writes, and the reader memory-maps every column
+# file once and hands out slices of the map, so reading a case copies nothing.
+
+import json
+import os
+import numpy as np
+
+# Storage type of every column
+COLUMN_DTYPE = np.dtype('<f8')
+
+# Extension of the column files and name of the index file
+COLUMN_EXTENSION = '.f8'
+INDEX_FILE = 'index.jsonl'
+
+
+def _json_default(value):
+    # Metadata may contain NumPy scalars and arrays
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Metadata value {value!r} is not JSON serializable")
+
+
+class ResultStore:
+    def __init__(self, path):
+        """
+        Open (or create) the result store in the folder path.
+
+        Only one process should append to a store at a time; any number can read.
+        """
+        self.path = path
+        self.index_path = os.path.join(path, INDEX_FILE)
+        os.makedirs(path, exist_ok=True)
+        self._index = []
+        self._index_size = 0
+        self._maps = {}
+
+    def _column_path(self, column):
+        return os.path.join(self.path, column + COLUMN_EXTENSION)
+
+    def _column_length(self, column):
+        path = self._column_path(column)
+        return os.path.getsize(path) // COLUMN_DTYPE.itemsize if os.path.isfile(path) else 0
+
+    def append(self, case, meta=None, **columns):
+        """
+        Append one case.
+
+        Parameters:
+        case (str): Name of the case
+        meta (dict): JSON serializable metadata, e.g. the velocity and load factor
+        **columns (array): 1-D arrays of the case, e.g. position=..., moment=...
+
+        Returns:
+        int: Index of the case in the store
+        """
+        return self.append_many([(case, meta, columns)])[0]
+
+    def append_records(self, case, records, meta=None):
+        # Append a structured array (e.g. from calculate_distributions_array), one column per field
+        return self.append(case, meta, **{name: records[name] for name in records.dtype.names})
+
+    def append_many(self, cases, shared=None):
+        """
+        Append many cases with a single write per column file and one index write.
+
+        Parameters:
+        cases (iterable): (case, meta, columns) tuples, columns being a dict of 1-D arrays
+        shared (dict): Columns common to every case (e.g. the station positions), written
+                       once and referenced by the index entry of every case
+
+        Returns:
+        list: Indices of the appended cases
+        """
+        entries = []
+        chunks = {}
+        ends = {}
+
+        def add(column, values, case):
+            # Queue values for the column file and return their (offset, length)
+            values = np.asarray(values, dtype=COLUMN_DTYPE)
+            if values.ndim != 1:
+                raise ValueError(f"Column {column!r} of case {case!r} must be 1-D, got shape {values.shape}")
+            if column not in ends:
+                ends[column] = self._column_length(column)
+                chunks[column] = []
+            location = [ends[column], len(values)]
+            ends[column] += len(values)
+            chunks[column].append(values)
+            return location
+
+        shared_locations = {column: add(column, values, 'shared') for column, values in (shared or {}).items()}
+        for case, meta, columns in cases:
+            entry = {"case": str(case), "meta": meta or {}, "columns": dict(shared_locations)}
+            for column, values in columns.items():
+                entry["columns"][column] = add(column, values, case)
+            entries.append(entry)
+
+        # Column data first, so an interrupted append never leaves index lines pointing past the data
+        for column, arrays in chunks.items():
+            with open(self._column_path(column), 'ab') as f:
+                np.concatenate(arrays).tofile(f)
+            self._maps.pop(column, None)
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(entry, default=_json_default) + "\n" for entry in entries))
+
+        first = len(self.index())
+        return list(range(first - len(entries), first))
+
+    def index(self):
+        # Index entries of every case, reloaded when another writer appended cases
+        size = os.path.getsize(self.index_path) if os.path.isfile(self.index_path) else 0
+        if size != self._index_size:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                f.seek(self._index_size)
+                self._index.extend(json.loads(line) for line in f.read().splitlines() if line)
+            self._index_size = size
+        return self._index
+
+    def column(self, column):
+        # Read-only memory map of every value of column
+        length = self._column_length(column)
+        cached = self._maps.get(column)
+        if cached is None or len(cached) != length:
+            if length == 0:
+                cached = np.empty(0, dtype=COLUMN_DTYPE)
+            else:
+                cached = np.memmap(self._column_path(column), dtype=COLUMN_DTYPE, mode='r', shape=(length,))
+            self._maps[column] = cached
+        return cached
+
+    def find(self, case):
+        # Index of the last case named case
+        for i in range(len(self.index()) - 1, -1, -1):
+            if self._index[i]["case"] == case:
+                return i
+        raise KeyError(f"No case named {case!r} in {self.path}")
+
+    def read(self, case, columns=None):
+        """
+        Columns of a case as views into the memory-mapped column files.
+
+        Parameters:
+        case (int or str): Index or name of the case
+        columns (list): Columns to return, defaults to every column of the case
+
+        Returns:
+        dict: Column name -> read-only 1-D array
+        """
+        entry = self.index()[case if isinstance(case, (int, np.integer)) else self.find(case)]
+        names = entry["columns"] if columns is None else columns
+        return {name: self.column(name)[entry["columns"][name][0]:sum(entry["columns"][name])] for name in names}
+
+    def meta(self, case):
+        return self.index()[case if isinstance(case, (int, np.integer)) else self.find(case)]["meta"]
+
+    def __len__(self):
+        return len(self.index())
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._index[i]["case"], self.read(i)
+
+    def __repr__(self):
+        return f"ResultStore({self.path!r}, {len(self)} cases)"
@@ -1,5 +1,8 @@
 import numpy as np
 import logging
+from Aero_Logging import configure_logging
+
+logger = logging.getLogger(__name__)
 
 def calculate_reynolds_number(density, velocity, chord_length, dynamic_viscosity):
     """
@@ -32,6 +35,25 @@ def chord_length_at_position(root_chord, tip_chord, span, y_position):
     """
     return root_chord + (tip_chord - root_chord) * (y_position / (span / 2))
 
+def reynolds_numbers_at_positions(density, velocity, root_chord, tip_chord, span, dynamic_viscosity, y_positions):
+    """
+    Calculate the Reynolds number at every spanwise position of a tapered wing in one vectorized call.
+
+    Parameters:
+    density (float): Density of the fluid (kg/m^3)
+    velocity (float): Velocity of the fluid relative to the wing (m/s)
+    root_chord (float): Root chord length (m)
+    tip_chord (float): Tip chord length (m)
+    span (float): Total wingspan (m)
+    dynamic_viscosity (float): Dynamic viscosity of the fluid (Pa·s or N·s/m^2)
+    y_positions (array): Spanwise positions (m)
+
+    Returns:
+    ndarray: Reynolds number at each spanwise position
+    """
+    chord_lengths = chord_length_at_position(root_chord, tip_chord, span, np.asarray(y_positions, dtype=float))
+    return calculate_reynolds_number(density, velocity, chord_lengths, dynamic_viscosity)
+
 def main_reynolds(density, velocity, root_chord, tip_chord, span, dynamic_viscosity, num_positions=50):
     """
     Main function to calculate the average Reynolds number for a tapered wing given fluid properties and wing characteristics.
@@ -48,17 +70,17 @@ def main_reynolds(density, velocity, root_chord, tip_chord, span, dynamic_viscos
     Returns:
     float: Average Reynolds number
     """
-    logging.basicConfig(level=logging.INFO)
-    
     y_positions = np.linspace(0, span / 2, num_positions)
     reynolds_numbers = np.array([calculate_reynolds_number(density, velocity, chord_length_at_position(root_chord, tip_chord, span, y), dynamic_viscosity) for y in y_positions])
     
     average_reynolds_number = np.mean(reynolds_numbers)
-    logging.info(f"The average Reynolds number is: {average_reynolds_number:.2e}")
+    logger.info("The average Reynolds number is: %.2e", average_reynolds_number)
     return average_reynolds_number
 
 # Example usage
 if __name__ == "__main__":
+    configure_logging('log.txt', logging.INFO)
+
     # Define the input parameters
     density = 1.225  # kg/m^3 (density of air at sea level)
     velocity = 11.54  # m/s (example velocity)
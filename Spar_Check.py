@@ -0,0 +1,55 @@
+# Spar_Check.py
+# Checks of the EllipticalLiftDistribution spar sizing. Run as a script; every check
+# raises AssertionError on a mismatch.
+
+import numpy as np
+from Prandtl_Elliptical_Lift_Distribution import EllipticalLiftDistribution
+
+# Example wing of Prandtl_Elliptical_Lift_Distribution.py (inches, slugs/ft^3, ft/s)
+SPAN = 15 * 12
+LIFT_COEFFICIENT = 1.165
+RHO = 0.0023769
+VELOCITY = 38.0
+ROOT_CHORD = 3 * 12
+TIP_CHORD = 1 * 12
+YIELD_STRENGTH = 12742
+STATIONS = 22
+
+
+def example_moments():
+    distribution = EllipticalLiftDistribution(SPAN, LIFT_COEFFICIENT, RHO, VELOCITY, ROOT_CHORD, TIP_CHORD)
+    positions = np.linspace(0, SPAN / 2, STATIONS)
+    return distribution, distribution.calculate_distributions_array(positions)['moment']
+
+
+def check_download_sizing():
+    # A download (negative moments) must size the same spar as the upload of the same magnitude, in both sizing paths
+    distribution, moments = example_moments()
+    up = distribution.size_spar_sections(moments, YIELD_STRENGTH)
+    down = distribution.size_spar_sections(-moments, YIELD_STRENGTH)
+    for name, a, b in zip(('height', 'width', 'moment handled'), up, down):
+        if not np.array_equal(a, b):
+            raise AssertionError(f"Download spar {name} {b} differs from the upload {a}")
+    if np.any(np.isnan(down[0])):
+        raise AssertionError("Negative bending moments give NaN spar sections")
+    if distribution.size_spar(-moments, YIELD_STRENGTH) != distribution.size_spar(moments, YIELD_STRENGTH):
+        raise AssertionError("size_spar sizes a download differently from the upload")
+    print("Downloads size the same spar as uploads")
+    return True
+
+
+def check_sections_match_size_spar():
+    # size_spar on the largest moment gives the root section of size_spar_sections
+    distribution, moments = example_moments()
+    heights, widths, _ = distribution.size_spar_sections(moments, YIELD_STRENGTH)
+    h, b, _ = distribution.size_spar(moments, YIELD_STRENGTH)
+    i = int(np.argmax(np.abs(moments)))
+    if not (np.isclose(h, heights[i]) and np.isclose(b, widths[i])):
+        raise AssertionError(f"size_spar gives {h} x {b}, size_spar_sections {heights[i]} x {widths[i]}")
+    print("size_spar matches size_spar_sections at the largest moment")
+    return True
+
+
+if __name__ == "__main__":
+    check_download_sizing()
+    check_sections_match_size_spar()
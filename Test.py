@@ -1,8 +1,8 @@
 import matplotlib.pyplot as plt
 import logging
+from Aero_Logging import configure_logging
 
-# Configure logging
-logging.basicConfig(filename='Aileron_Loading_Log.log', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class Aileron:
     def __init__(self, root_chord_length_in, tip_chord_length_in, span_in, lift_coefficient, rho_slug_ft3, velocity_ft_s, deflection_angle):
@@ -13,11 +13,12 @@ class Aileron:
         self.rho_slug_ft3 = rho_slug_ft3
         self.velocity_ft_s = velocity_ft_s
         self.deflection_angle = deflection_angle
-        logging.info(f'Aileron initialized with root_chord_length_in={root_chord_length_in}, tip_chord_length_in={tip_chord_length_in}, span_in={span_in}, lift_coefficient={lift_coefficient}, rho_slug_ft3={rho_slug_ft3}, velocity_ft_s={velocity_ft_s}, deflection_angle={deflection_angle}')
+        logger.info('Aileron initialized with root_chord_length_in=%s, tip_chord_length_in=%s, span_in=%s, lift_coefficient=%s, rho_slug_ft3=%s, velocity_ft_s=%s, deflection_angle=%s',
+                    root_chord_length_in, tip_chord_length_in, span_in, lift_coefficient, rho_slug_ft3, velocity_ft_s, deflection_angle)
 
     def calculate_average_chord_length(self):
         average_chord_length_in = (self.root_chord_length_in + self.tip_chord_length_in) / 2
-        logging.info(f'Calculated average_chord_length_in={average_chord_length_in}')
+        logger.debug('Calculated average_chord_length_in=%s', average_chord_length_in)
         return average_chord_length_in
 
     def calculate_lift_force(self):
@@ -30,25 +31,26 @@ class Aileron:
         
         lift_per_unit_span = q * adjusted_lift_coefficient * average_chord_length_ft
         total_lift_force = lift_per_unit_span * (self.span_in / 12)  # Convert inches to feet
-        logging.info(f'Calculated lift_force_lb={total_lift_force} with q={q}, average_chord_length_in={average_chord_length_in}, lift_per_unit_span={lift_per_unit_span}, adjusted_lift_coefficient={adjusted_lift_coefficient}')
+        logger.info('Calculated lift_force_lb=%s with q=%s, average_chord_length_in=%s, lift_per_unit_span=%s, adjusted_lift_coefficient=%s',
+                    total_lift_force, q, average_chord_length_in, lift_per_unit_span, adjusted_lift_coefficient)
         return total_lift_force
 
     def calculate_moment_arm(self, hinge_line_position_in):
         average_chord_length_in = self.calculate_average_chord_length()
         center_of_pressure_in = 0.25 * average_chord_length_in
         moment_arm_in = center_of_pressure_in - hinge_line_position_in
-        logging.info(f'Calculated moment_arm_in={moment_arm_in} with center_of_pressure_in={center_of_pressure_in}')
+        logger.info('Calculated moment_arm_in=%s with center_of_pressure_in=%s', moment_arm_in, center_of_pressure_in)
         return moment_arm_in
 
     def calculate_torque(self, hinge_line_position_in):
         lift_force_lb = self.calculate_lift_force()
         moment_arm_in = self.calculate_moment_arm(hinge_line_position_in)
         torque_in_lb = lift_force_lb * moment_arm_in
-        logging.info(f'Calculated torque_in_lb={torque_in_lb} with lift_force_lb={lift_force_lb}, moment_arm_in={moment_arm_in}')
+        logger.info('Calculated torque_in_lb=%s with lift_force_lb=%s, moment_arm_in=%s', torque_in_lb, lift_force_lb, moment_arm_in)
         return torque_in_lb
 
     def draw_wing_with_aileron(self, wing_root_chord_in, wing_tip_chord_in, wing_span_in):
-        logging.info(f'Drawing wing with aileron with wing_root_chord_in={wing_root_chord_in}, wing_tip_chord_in={wing_tip_chord_in}, wing_span_in={wing_span_in}')
+        logger.info('Drawing wing with aileron with wing_root_chord_in=%s, wing_tip_chord_in=%s, wing_span_in=%s', wing_root_chord_in, wing_tip_chord_in, wing_span_in)
         fig, ax = plt.subplots()
         
         # Define the coordinates of the wing (left half)
@@ -120,6 +122,9 @@ class Aileron:
 
 # Example usage
 if __name__ == "__main__":
+    # Configure logging
+    configure_logging('Aileron_Loading_Log.log', logging.INFO)
+
     root_chord_length_in = 6  # Root chord length in inches (0.5 feet)
     tip_chord_length_in = 4  # Tip chord length in inches (0.333 feet)
     span_in = 31  # Span in inches (2.58333 feet)
@@ -0,0 +1,226 @@
+# VLM_Cache.py
+# Disk cache of aerosandbox VortexLatticeMethod results.
+#
+# A result is stored under the SHA-256 of a canonical JSON description of
+# everything that determines it: the wing cross sections (leading edge, chord,
+# twist, airfoil name and coordinates), the operating point, the solver settings
+# and the aerosandbox version. Identical requests are read back from disk instead
+# of solved again. The cache is bounded in size and evicts the least recently
+# used entries first (every hit refreshes the file modification time).
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Folder with the cached results
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.vlm_cache')
+
+# Total size of the cached results (bytes) above which old entries are evicted
+MAX_CACHE_BYTES = 256 * 2**20
+
+# VortexLatticeMethod attributes stored with the aero dict, when present after run()
+PANEL_FIELDS = ('front_left_vertices', 'back_left_vertices', 'back_right_vertices', 'front_right_vertices',
+                'vortex_strengths', 'forces_geometry', 'moments_geometry')
+
+# OperatingPoint attributes that enter the key
+OP_POINT_FIELDS = ('velocity', 'alpha', 'beta', 'p', 'q', 'r')
+
+CACHE_EXTENSION = '.pkl'
+
+
+def _canonical(value):
+    # JSON friendly, deterministic form of numbers, arrays, sequences and mappings
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _canonical(value.tolist())
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return repr(float(value))
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    return repr(value)
+
+
+def airfoil_description(airfoil):
+    coordinates = getattr(airfoil, 'coordinates', None)
+    return {
+        'name': getattr(airfoil, 'name', None),
+        'coordinates': None if coordinates is None else np.asarray(coordinates, dtype=np.float64),
+    }
+
+
+def wing_description(wing):
+    return {
+        'name': getattr(wing, 'name', None),
+        'symmetric': getattr(wing, 'symmetric', None),
+        'xsecs': [{
+            'xyz_le': np.asarray(xsec.xyz_le, dtype=np.float64),
+            'chord': xsec.chord,
+            'twist': getattr(xsec, 'twist', 0.0),
+            'airfoil': airfoil_description(xsec.airfoil),
+        } for xsec in wing.xsecs],
+    }
+
+
+def vlm_description(airplane, op_point, **settings):
+    """
+    Everything that determines a VortexLatticeMethod result.
+
+    Parameters:
+    airplane (asb.Airplane): Geometry (reference point and wings)
+    op_point (asb.OperatingPoint): Flight condition
+    **settings: VortexLatticeMethod keyword arguments (resolutions, spacing, ...)
+
+    Returns:
+    dict: Description used to build the cache key
+    """
+    atmosphere = getattr(op_point, 'atmosphere', None)
+    try:
+        import aerosandbox
+        version = aerosandbox.__version__
+    except ImportError:
+        version = None
+    return {
+        'aerosandbox': version,
+        'xyz_ref': np.asarray(getattr(airplane, 'xyz_ref', [0, 0, 0]), dtype=np.float64),
+        'wings': [wing_description(wing) for wing in airplane.wings],
+        'op_point': {field: getattr(op_point, field, None) for field in OP_POINT_FIELDS},
+        'altitude': getattr(atmosphere, 'altitude', None),
+        'settings': settings,
+    }
+
+
+def vlm_key(airplane, op_point, **settings):
+    text = json.dumps(_canonical(vlm_description(airplane, op_point, **settings)), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class VLMCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + CACHE_EXTENSION)
+
+    def get(self, key):
+        # Cached entry for key, or None. A hit marks the entry as recently used
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Truncated or stale pickle (unpickling can raise almost anything): drop it and count a miss
+            logger.warning("Discarding unreadable VLM cache entry %s: %s", path, e)
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        # Store entry under key. The cache is only an optimization, so a failed write is logged and ignored
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)  # Readers never see a partly written entry
+        except OSError as e:
+            logger.warning("Could not write VLM cache entry %s: %s", path, e)
+            self._remove(temporary)
+            return
+        self.evict()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def evict(self):
+        # Remove the least recently used entries until the cache fits in max_bytes
+        entries = [(stat.st_mtime, stat.st_size, name) for name, stat in self._entries()]
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass  # Already removed by another process sharing the cache
+            total -= size
+
+    def _entries(self):
+        # (name, stat) of every cached entry. Other processes sharing the cache may remove
+        # or replace files between the listing and the stat, those entries are skipped
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(CACHE_EXTENSION):
+                try:
+                    yield name, os.stat(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+
+    def size(self):
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def clear(self):
+        for name, _ in list(self._entries()):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def run(self, airplane, op_point, **settings):
+        """
+        Cached asb.VortexLatticeMethod(airplane=airplane, op_point=op_point, **settings).run().
+
+        Returns:
+        tuple: (aero dict, panel arrays dict, solved VortexLatticeMethod or None on a cache hit)
+        """
+        key = vlm_key(airplane, op_point, **settings)
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            logger.debug("VLM cache hit %s", key)
+            return entry['aero'], entry['panels'], None
+
+        import aerosandbox as asb
+        self.misses += 1
+        logger.debug("VLM cache miss %s", key)
+        vlm = asb.VortexLatticeMethod(airplane=airplane, op_point=op_point, **settings)
+        aero = vlm.run()
+        panels = {field: np.asarray(getattr(vlm, field)) for field in PANEL_FIELDS if hasattr(vlm, field)}
+        self.put(key, {'aero': dict(aero), 'panels': panels})
+        return aero, panels, vlm
+
+
+# Cache shared by the scripts
+vlm_cache = VLMCache()
+
+
+def cached_vlm_run(airplane, op_point, **settings):
+    return vlm_cache.run(airplane, op_point, **settings)
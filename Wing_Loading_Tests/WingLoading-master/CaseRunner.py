@@ -0,0 +1,85 @@
+#runs flight envelope cases of one wing in parallel. Every case gets its own LoadingDiagram built from immutable inputs,
+#so no state is shared between cases and the results come back in the order of the cases
+from LoadingDiagram import LoadingDiagram as LD
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
+import time
+
+Geometry = namedtuple("Geometry", ["span", "rootChord", "taperRatio", "sweep", "alpha", "Cls", "Cm25s", "Tcs", "segmentcount"])
+Case = namedtuple("Case", ["loadFactor", "fuelLevel", "V", "rho"])
+
+#wing of main.calculateCases
+ENVELOPE_GEOMETRY = Geometry(
+    41.1,   #wingspan [m]
+    6.76,   #rootchord [m]
+    0.29,   #taperratio
+    31.2,   #sweep0.25c [deg]
+    0.0,    #AoA [deg]
+    ((0.675, 6.06189, 0.0), (0.55, 5.723848, 0.7)),
+    ((-0.1507, 0.252101, 0.0), (-0.1147, 0.257831, 0.7)),
+    ((0.14, 0.0), (0.1, 0.7)),
+    20
+)
+
+#(load factor, fuel level, V, rho) of the cases in main.calculateCases
+ENVELOPE_CASES = [
+    Case(-1.0, 0.0, 118.4, 1.225), Case(-1.0, 0.7, 118.4, 1.225),
+    Case(2.5, 0.0, 118.38, 1.225), Case(2.5, 0.7, 118.38, 1.225), Case(2.5, 1.0, 118.38, 1.225),
+    Case(2.0, 0.0, 147.98, 1.225), Case(2.0, 0.7, 147.98, 1.225), Case(2.0, 1.0, 147.98, 1.225)
+]
+
+def buildDiagram(geometry, case):
+    #LoadingDiagram of the geometry with the load factor and fuel level of the case
+    diagram = LD(geometry.span, geometry.rootChord, geometry.taperRatio, geometry.sweep, geometry.alpha, case.loadFactor,
+                 [tuple(cl) for cl in geometry.Cls], [tuple(cm) for cm in geometry.Cm25s], [tuple(tc) for tc in geometry.Tcs])
+    diagram.segmentcount = geometry.segmentcount
+    diagram.fuelLevel = case.fuelLevel
+    diagram.generateSegments()
+    return diagram
+
+def runCase(geometry, case, delta=6.16, theta=10.0, method="step"):
+    #lift distribution, diagrams and required spar and skin thickness of one case. delta=None skips the sizing
+    diagram = buildDiagram(geometry, case)
+    result = {"case": case, "lift": diagram.genLiftDist(case.V, case.rho)}
+    diagram.computeDiagrams(case.V, case.rho)
+    result["thickness"] = diagram.getRequiredThickness(delta, theta, method=method) if delta is not None else None
+    result["diagrams"] = diagram.diagrams
+    return result
+
+def runCases(geometry, cases, maxWorkers=None, delta=6.16, theta=10.0, method="step"):
+    #runs every case in a process pool (in this process for maxWorkers=1). returns the results in the order of cases
+    cases = [Case(*case) for case in cases]
+    n = len(cases)
+    if maxWorkers == 1 or n < 2:
+        return [runCase(geometry, case, delta, theta, method) for case in cases]
+    maxWorkers = min(maxWorkers or os.cpu_count() or 1, n)
+    with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+        return list(executor.map(runCase, repeat(geometry, n), cases, repeat(delta, n), repeat(theta, n), repeat(method, n),
+                                 chunksize=max(1, n//(4*maxWorkers))))
+
+def benchmark(cases=ENVELOPE_CASES, geometry=ENVELOPE_GEOMETRY, workers=None, repeats=1):
+    #times the serial loop of the script against the process pool for 1, 2, 4, ... workers up to the core count
+    cases = list(cases)*repeats
+    if workers is None:
+        workers = [1]
+        while workers[-1]*2 <= (os.cpu_count() or 1):
+            workers.append(workers[-1]*2)
+    start = time.perf_counter()
+    serial = [runCase(geometry, case) for case in cases]
+    serialTime = time.perf_counter()-start
+    print("{} cases, serial: {:.2f} s".format(len(cases), serialTime))
+    timings = {"serial": serialTime}
+    for n in workers:
+        start = time.perf_counter()
+        results = runCases(geometry, cases, maxWorkers=n)
+        timings[n] = time.perf_counter()-start
+        assert [r["thickness"] for r in results] == [r["thickness"] for r in serial]
+        print("{} workers: {:.2f} s, speed-up {:.2f}".format(n, timings[n], serialTime/timings[n]))
+    return timings
+
+if __name__ == "__main__":
+    for result in runCases(ENVELOPE_GEOMETRY, ENVELOPE_CASES):
+        print(result["case"], "root moment: {:.4g} [Nm], thickness: {}".format(result["diagrams"]["Moment"]["Ms"][0], result["thickness"]))
+    benchmark()
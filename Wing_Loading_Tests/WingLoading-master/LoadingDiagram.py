@@ -1,6 +1,34 @@
-import matplotlib.pyplot as plt
 from math import sin, cos, radians, pi
-from numpy import arange
+import numpy as np
+
+#columns of the segment table, one row per segment. rows can still be indexed by position, seg[4] is x1
+SEGMENT_DTYPE = np.dtype([
+    ("S", np.float64),      #area of the segment [m^2]
+    ("cl", np.float64),     #average lift coefficient
+    ("cm", np.float64),     #average moment coefficient around the quarter chord
+    ("m", np.float64),      #weight of the fuel in the segment [N]
+    ("x1", np.float64),     #inboard edge as a fraction of the half span
+    ("x2", np.float64),     #outboard edge as a fraction of the half span
+    ("cr", np.float64),     #average chord [m]
+    ("h", np.float64)       #average airfoil thickness [m]
+])
+
+#fuel mass per unit of half span fraction with full tanks, FUEL_MASS[0]*x^2 + FUEL_MASS[1]*x + FUEL_MASS[2] [kg] for x < FUEL_END.
+#integrated over the 20 segments of the original model it gives back its per segment masses 1.8306*k^2 - 104.7*k + 1497.3, k = 1..14
+FUEL_MASS = (1.8306*20**3, (1.8306 - 104.7)*20**2, (1497.3 - 1.8306/3 + (1.8306 - 104.7)/2)*20)
+FUEL_END = 0.7      #outboard end of the tanks as a fraction of the half span
+
+def interpolateBreakpoints(x, xs, values):
+    #piecewise linear interpolation of values between the ascending breakpoints xs, constant before the first and after the last.
+    #x can be an array; values can hold several rows (last axis along xs), which are all interpolated with one searchsorted
+    xs = np.asarray(xs, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+    if len(xs) == 1:
+        return np.multiply.outer(values[..., 0], np.ones_like(x))
+    j = np.clip(np.searchsorted(xs, x, side="right"), 1, len(xs)-1)
+    w = np.clip((x - xs[j-1])/(xs[j] - xs[j-1]), 0.0, 1.0)
+    return values[..., j-1] + w*(values[..., j] - values[..., j-1])
 
 class LoadingDiagram:
     def __init__(self,
@@ -28,187 +56,145 @@ class LoadingDiagram:
         #self.c_l_alpha = c_l_alpha
         self.tank = tank
         self.segmentcount = 20
-        self.fuelLevel = 0.0
         self.__segments = None
+        self.__fuelWeight = None
+        self.__unitDiagrams = None
+        self.fuelLevel = 0.0
         self.generateSegments()
         self.diagrams = {}
         
+    def coefficientBreakpoints(self, table):
+        #breakpoint positions and values cl0 + cla*alpha of self.cls or self.cms
+        return [point[2] for point in table], [point[1]*self.a + point[0] for point in table]
+
     def getCl(self, x1, x2):
+        #average of the lift coefficient at both edges of a segment, x1 and x2 can be arrays
         #c_l_alpha = 5.723848
-
-        cl1 = None
-        cl2 = None
-        if x2 > 1.0: x2 = 1.0
-        for i in range(len(self.cls)):
-            if x1<self.cls[i][2]:
-                if i > 0:
-                    cl1 = ((
-                        #c_l_alpha_2   *alpha_2+ cl0_2         -(c_l_alpha_1     *alpha_1+ cl0_1)
-                        (self.cls[i][1]*self.a + self.cls[i][0]-(self.cls[i-1][1]*self.a + self.cls[i-1][0]))
-                        /
-                        #   x2         -    x1                  + (c_l_alpha_1    *alpha_1+ cl0_1)
-                        (self.cls[i][2]-self.cls[i-1][2])) * x1 + self.cls[i-1][1]*self.a + self.cls[i-1][0])
-                else:
-                    cl1 = self.cls[i][1]*self.a + self.cls[i][0]
-                break
-        if cl1 == None: cl1 = self.cls[-1][1]*self.a + self.cls[-1][0]
-        for i in range(len(self.cls)):
-            if x2<self.cls[i][2]:
-                if i > 0:
-                    cl2 = ((
-                        #c_l_alpha_2   *alpha_2+ cl0_2         -(c_l_alpha_1     *alpha_1+ cl0_1)
-                        (self.cls[i][1]*self.a + self.cls[i][0]-(self.cls[i-1][1]*self.a + self.cls[i-1][0]))
-                        /
-                        #   x2         -    x1                  + (c_l_alpha_1    *alpha_1+ cl0_1)
-                        (self.cls[i][2]-self.cls[i-1][2])) * x2 + self.cls[i-1][1]*self.a + self.cls[i-1][0])
-                else:
-                    cl2 = self.cls[i][1]*self.a + self.cls[i][0]
-                break 
-        if cl2 == None: cl2 = self.cls[-1][1]*self.a + self.cls[-1][0]
-
-        return (cl1+cl2)/2
+        cls = interpolateBreakpoints(np.clip([x1, x2], 0.0, 1.0), *self.coefficientBreakpoints(self.cls))
+        return (cls[0]+cls[1])/2
 
     def getChord(self, x):
         return self.cr - self.cr*x*(1-self.TR)
 
     def getThickness(self, x, cr):
-        tc = None
-        for i in range(len(self.Tcs)):
-            if x<self.Tcs[i][1]:
-                if i>0:
-                    tc = (self.Tcs[i][0] - self.Tcs[i-1][0])/(self.Tcs[i][1] - self.Tcs[i-1][1])*x + self.Tcs[i-1][0]
-                else: tc = self.Tcs[i-1][0]
-                break
-        if tc == None: tc = self.Tcs[-1][0]
+        tc = interpolateBreakpoints(x, [tc[1] for tc in self.Tcs], [tc[0] for tc in self.Tcs])
         return tc*cr
 
-    def getMass(self, segment): #THIS IS NOT INDEPENDENT OF SEGMENTCOUNT. ONLY WORKS FOR 20 SEGMENTS
+    def getFuelWeight(self, x1, x2): #weight of the fuel between x1 and x2 (fractions of the half span) with full tanks. works on arrays of segments
+        x1 = np.clip(x1, 0.0, FUEL_END)
+        x2 = np.clip(x2, 0.0, FUEL_END)
+        #exact integral of the fuel mass distribution, so the total does not depend on segmentcount
+        antiderivative = (FUEL_MASS[0]/3, FUEL_MASS[1]/2, FUEL_MASS[2], 0.0)
+        Mfuel = np.polyval(antiderivative, x2) - np.polyval(antiderivative, x1)
+        return Mfuel*9.81
+
+    def getMass(self, segment): #fuel weight of segment number segment at the current fuel level
         #Mwing = -13.99*(segment+1) + 401.86 
-        Mfuel = 0.0 if segment > 13 else 1.8306*(segment+1)**2 - 104.7*(segment+1) + 1497.3
-        return Mfuel*self.fuelLevel*9.81
+        return self.getFuelWeight(segment/self.segmentcount, (segment+1)/self.segmentcount)*self.fuelLevel
+
+    @property
+    def fuelLevel(self):
+        return self.__fuelLevel
+
+    @fuelLevel.setter
+    def fuelLevel(self, fuelLevel):
+        #only the weight column of the segment table depends on the fuel level, the rest of the table is kept
+        self.__fuelLevel = fuelLevel
+        if self.__segments is not None:
+            self.__setColumn("m", self.__fuelWeight*fuelLevel)
+
+    def __setColumn(self, name, values):
+        self.__segments.flags.writeable = True
+        self.__segments[name] = values
+        self.__segments.flags.writeable = False
 
 
     def getCm(self, x1,x2):
-        cm1 = None
-        cm2 = None
-        if x1 < 0.0: x1 = 0.0
-        if x2 > 1.0: x2 = 1.0
-        for i in range(len(self.cms)):
-            if x1<self.cms[i][2]:
-                if i > 0:
-                    cm1 = ((
-                        #c_m_alpha_2   *alpha_2+ cm0_2         -(c_m_alpha_1     *alpha_1+ cm0_1)
-                        (self.cms[i][1]*self.a + self.cms[i][0]-(self.cms[i-1][1]*self.a + self.cms[i-1][0]))
-                        /
-                        #   x2         -    x1                  + (c_l_alpha_1    *alpha_1+ cl0_1)
-                        (self.cms[i][2]-self.cms[i-1][2])) * x1 + self.cms[i-1][1]*self.a + self.cms[i-1][0])
-                else:
-                    cm1 = self.cms[i][1]*self.a + self.cms[i][0]
-                break
-        if cm1 == None: cm1 = self.cms[-1][1]*self.a + self.cms[-1][0]
-        for i in range(len(self.cms)):
-            if x2<self.cms[i][2]:
-                if i > 0:
-                    cm2 = ((
-                        #c_l_alpha_2   *alpha_2+ cl0_2         -(c_l_alpha_1     *alpha_1+ cl0_1)
-                        (self.cms[i][1]*self.a + self.cms[i][0]-(self.cms[i-1][1]*self.a + self.cms[i-1][0]))
-                        /
-                        #   x2         -    x1                  + (c_l_alpha_1    *alpha_1+ cl0_1)
-                        (self.cms[i][2]-self.cms[i-1][2])) * x2 + self.cms[i-1][1]*self.a + self.cms[i-1][0])
-                else:
-                    cm2 = self.cms[i][1]*self.a + self.cms[i][0]
-                break 
-        if cm2 == None: cm2 = self.cms[-1][1]*self.a + self.cms[-1][0]
-
-        return (cm1+cm2)/2
+        cms = interpolateBreakpoints(np.clip([x1, x2], 0.0, 1.0), *self.coefficientBreakpoints(self.cms))
+        return (cms[0]+cms[1])/2
 
     def generateSegments(self):
-        self.__segments = [] #half of the wing
-        segmentwidth = self.b/2/self.segmentcount
-        for i in range(self.segmentcount):
-            x1 = i/self.segmentcount
-            x2 = (i+1)/self.segmentcount
-            S  =  (self.getChord(x1)+self.getChord(x2))*segmentwidth/2
-            cl = self.getCl(x1,x2)
-            cm = self.getCm(x1,x2)
-            m = self.getMass(i)
-            cr = (self.getChord(x1)+self.getChord(x2))/2
-            h = self.getThickness((x1+x2)/2, cr)
-            self.__segments.append((S, cl, cm, m, x1, x2, cr, h))
-    
+        #builds the segment table of half of the wing. needed again after changing the geometry or segmentcount
+        n = self.segmentcount
+        segmentwidth = self.b/2/n
+        segments = np.empty(n, dtype=SEGMENT_DTYPE)
+        edges = np.arange(n+1)/n
+        segments["x1"] = edges[:-1]
+        segments["x2"] = edges[1:]
+        #chord, cl and cm at every segment edge, then averaged over each segment
+        chords = self.getChord(edges)
+        cls = interpolateBreakpoints(edges, *self.coefficientBreakpoints(self.cls))
+        cms = interpolateBreakpoints(edges, *self.coefficientBreakpoints(self.cms))
+        segments["cr"] = (chords[:-1]+chords[1:])/2
+        segments["S"] = segments["cr"]*segmentwidth
+        segments["cl"] = (cls[:-1]+cls[1:])/2
+        segments["cm"] = (cms[:-1]+cms[1:])/2
+        segments["h"] = self.getThickness((edges[:-1]+edges[1:])/2, segments["cr"])
+        self.__fuelWeight = self.getFuelWeight(segments["x1"], segments["x2"])
+        segments["m"] = self.__fuelWeight*self.fuelLevel
+        segments.flags.writeable = False
+        self.__segments = segments
+        self.__unitDiagrams = None
+
     def getSegments(self):
+        #read-only segment table, see SEGMENT_DTYPE for the columns
         return self.__segments
-        
+
     def genLiftDist(self, V, rho):
         V = V#*cos(self.sweep)
-        Xs = []
-        Ls = []
-        segmentwidth = (self.b/2)/self.segmentcount
-        for segment in self.__segments:
-            Li = 0.5*V*V*rho*segment[0]*segment[1] * self.loadFactor *cos(self.a)
-            Xs.append((segment[3]+segment[4])/2*(self.b/2))
-            Ls.append(Li)
+        seg = self.__segments
+        Ls = 0.5*V*V*rho*seg["S"]*seg["cl"] * self.loadFactor *cos(self.a)
+        Xs = (seg["x1"]+seg["x2"])/2*(self.b/2)
+        Xs, Ls = Xs.tolist(), Ls.tolist()
         #print("total lift:", sum(Ls))
         #plt.plot(Xs,Ls)
         #plt.show()
         return {"Xs":Xs,"Ls":Ls}
 
-    def genMomentDiagram(self, V, rho):
+    def segmentForces(self, V, rho):
+        #per segment net normal force (lift - weight) and torque force, computed once for all segments
+        seg = self.__segments
+        q = 0.5*V*V*rho*self.loadFactor*cos(self.a)
+        d_shear = self.getChord(seg["x1"])/4
+        return {
+            "x1": seg["x1"]*(self.b/2),                 #inboard edge of the segment
+            "xc": (seg["x1"]+seg["x2"])/2*(self.b/2),   #center of the segment
+            "F": q*seg["S"]*seg["cl"] - seg["m"],
+            "Ft": q*seg["S"]*(seg["cm"] + seg["cl"]*d_shear)
+        }
+
+    @staticmethod
+    def _outboardSum(values):
+        #sum of values[j] for j >= i, for every i
+        return np.cumsum(values[::-1])[::-1]
+
+    def genMomentDiagram(self, V, rho, forces=None):
         #V = V*cos(self.sweep)
-        Xs = []
-        Ms = []
-        for i in range(len(self.__segments)):
-            segment = self.__segments[i]
-            moment = 0.0
-            x1 = segment[4]*(self.b/2)
-            for j in range(i,len(self.__segments)):
-                segi = self.__segments[j]
-                Fi = 0.5*V*V*rho*segi[0]*segi[1] * self.loadFactor*cos(self.a) - segi[3]
-                x2 = (segi[4]+segi[5])/2*(self.b/2)
-                moment += Fi*(x2-x1)
-
-            Ms.append(moment)
-            Xs.append(x1)
+        if forces is None: forces = self.segmentForces(V, rho)
+        #sum(F_j*(xc_j - x1_i)) = sum(F_j*xc_j) - x1_i*sum(F_j)
+        Ms = self._outboardSum(forces["F"]*forces["xc"]) - forces["x1"]*self._outboardSum(forces["F"])
+        Xs = forces["x1"].tolist()
+        Ms = Ms.tolist()
 
         Xs.append(self.b/2)
         Ms.append(0)
         return {"Xs":Xs, "Ms":Ms}
 
-    def genShearDiagram(self, V, rho):
+    def genShearDiagram(self, V, rho, forces=None):
        # V = V*cos(self.sweep)
-        Xs = []
-        Vs = []
-        for i in range(len(self.__segments)):
-            segment = self.__segments[i]
-            shear = 0.0
-            x1 = segment[4]*(self.b/2)
-            for j in range(i,len(self.__segments)):
-                segi = self.__segments[j]
-                Fi = 0.5*V*V*rho*segi[0]*segi[1] * self.loadFactor*cos(self.a) - segi[3]
-                shear += Fi
-            Vs.append(shear)
-            Xs.append(x1)
+        if forces is None: forces = self.segmentForces(V, rho)
+        Xs = forces["x1"].tolist()
+        Vs = self._outboardSum(forces["F"]).tolist()
 
         Xs.append(self.b/2)
         Vs.append(0)
         return {"Xs":Xs, "Vs":Vs}
 
-    def genTorqueDiagram(self, V, rho):
+    def genTorqueDiagram(self, V, rho, forces=None):
         #V = V*cos(self.sweep)
-        Xs = []
-        Ts = []
-        for i in range(len(self.__segments)):
-            segment = self.__segments[i]
-            torque = 0.0
-            x1 = segment[4]*(self.b/2)
-            for j in range(i,len(self.__segments)):
-                segi = self.__segments[j]
-                d_shear = self.getChord(segi[4])/4
-                ct = segi[2] + segi[1]*d_shear
-                Fi = 0.5*V*V*rho*segi[0]*ct*self.loadFactor*cos(self.a)
-                torque += Fi
-            Ts.append(torque)
-            Xs.append(x1)
+        if forces is None: forces = self.segmentForces(V, rho)
+        Xs = forces["x1"].tolist()
+        Ts = self._outboardSum(forces["Ft"]).tolist()
 
         #plt.plot(Xs, Ts)
         #plt.ylim(ymin=0)
@@ -216,153 +202,184 @@ class LoadingDiagram:
         #plt.show()
         return {"Xs":Xs, "Ts":Ts}
 
-    def genDiagrams(self, V, rho, filename=None):
-        
-    #generate moment diagram
-        moments =self.genMomentDiagram(V,rho)
-        ax1 = plt.subplot(311
-        #title="Momentdiagram"
-        )
-        plt.plot(moments["Xs"], moments["Ms"])
-        plt.title("Diagrams over half of the wing\n for V={} [m/s], n={} and fuel level={}".format(V, self.loadFactor, self. fuelLevel))
-        plt.xlim(xmin=0.0)
-        if moments["Ms"][0] > 0:
-            plt.ylim(ymin=0.0)
-        else: 
-            plt.ylim(ymax=0.0)
-        plt.ylabel("Moment [N*m]")
-        plt.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
-        plt.setp(ax1.get_xticklabels(), visible=False)
-        
-    #generate shear diagram
-        shears = self.genShearDiagram(V, rho)
-
-        ax2 = plt.subplot(312, 
-        #title="sheardiagram",
-        sharex=ax1
-        )
-        plt.plot(shears["Xs"], shears["Vs"])
-        plt.xlim(xmin=0.0) 
-        if shears["Vs"][0] > 0:
-            plt.ylim(ymin=0.0)
-        else: 
-            plt.ylim(ymax=0.0)
-        plt.ylabel("Shear [N]")
-        plt.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
-        plt.setp(ax2.get_xticklabels(), visible=False)
-
-    #generate torque diagram
-        torques = self.genTorqueDiagram(V, rho)
-        ax3 = plt.subplot(313, 
-        #title="torquediagram",
-        sharex=ax1
-        )
-        plt.plot(torques["Xs"], torques["Ts"])
-        plt.xlim(xmin=0.0)
-        if torques["Ts"][0] > 0:
-            plt.ylim(ymin=0.0)
-        else: 
-            plt.ylim(ymax=0.0)
-        plt.ylabel("Torque [N*m]")
-        plt.xlabel("x position along the wing [m]")
-        plt.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
+    def dynamicPressure(self, V, rho, loadFactor=None):
+        #q*n*cos(alpha), the factor of the aerodynamic part of the diagrams
+        loadFactor = self.loadFactor if loadFactor is None else loadFactor
+        return 0.5*V*V*rho*loadFactor*cos(self.a)
 
-        
-        if filename!=None:
-            #tikz_save(filename)
-            plt.savefig(filename.split(".")[0]+".png")
-            print("Plots saved to file")
-        else:
-            plt.show()
-            
-        plt.close()
-
-        diagrams =  {
-        "Moment":moments,
-        "Shear":shears,
-        "Torque":torques
+    def unitDiagrams(self):
+        #moment, shear and torque at the inboard edge of every segment for a unit dynamicPressure ("aero") and for full tanks ("fuel").
+        #they only depend on the geometry, so they are kept until generateSegments is called again
+        if self.__unitDiagrams is None:
+            seg = self.__segments
+            x1 = seg["x1"]*(self.b/2)
+            xc = (seg["x1"]+seg["x2"])/2*(self.b/2)
+            def moments(F):
+                return self._outboardSum(F*xc) - x1*self._outboardSum(F)
+            lift = seg["S"]*seg["cl"]
+            torque = seg["S"]*(seg["cm"] + seg["cl"]*self.getChord(seg["x1"])/4)
+            self.__unitDiagrams = {
+                "Xs": x1,
+                "aero": {"Ms": moments(lift), "Vs": self._outboardSum(lift), "Ts": self._outboardSum(torque)},
+                "fuel": {"Ms": moments(self.__fuelWeight), "Vs": self._outboardSum(self.__fuelWeight)}
+            }
+        return self.__unitDiagrams
+
+    def evaluateEnvelope(self, V, rho, loadFactor=None, fuelLevel=None):
+        #diagrams of many flight conditions by scaling the cached unit diagrams. V, rho, loadFactor and fuelLevel are broadcast
+        #against each other (None uses the current value). returns "Xs" (stations + tip) and "Ms", "Vs" (cases x stations + tip) and "Ts" (cases x stations)
+        unit = self.unitDiagrams()
+        loadFactor = self.loadFactor if loadFactor is None else loadFactor
+        fuelLevel = self.fuelLevel if fuelLevel is None else fuelLevel
+        V, rho, loadFactor, fuelLevel = (np.asarray(value, dtype=np.float64) for value in (V, rho, loadFactor, fuelLevel))
+        q, fuel = np.broadcast_arrays(self.dynamicPressure(V, rho, loadFactor), fuelLevel)
+        q = q[..., np.newaxis]
+        fuel = fuel[..., np.newaxis]
+        tip = np.zeros(q.shape)
+        return {
+            "Xs": np.append(unit["Xs"], self.b/2),
+            "Ms": np.concatenate([q*unit["aero"]["Ms"] - fuel*unit["fuel"]["Ms"], tip], axis=-1),
+            "Vs": np.concatenate([q*unit["aero"]["Vs"] - fuel*unit["fuel"]["Vs"], tip], axis=-1),
+            "Ts": q*unit["aero"]["Ts"]
+        }
+
+    def evaluateDiagrams(self, V, rho, loadFactor=None):
+        #same diagrams as computeDiagrams, from the cached unit diagrams
+        envelope = self.evaluateEnvelope(V, rho, loadFactor)
+        Xs = envelope["Xs"].tolist()
+        diagrams = {
+        "Moment":{"Xs":Xs, "Ms":envelope["Ms"].tolist()},
+        "Shear":{"Xs":Xs, "Vs":envelope["Vs"].tolist()},
+        "Torque":{"Xs":Xs[:-1], "Ts":envelope["Ts"].tolist()}
         }
         self.diagrams = diagrams
         return diagrams
 
+    def computeDiagrams(self, V, rho):
+        #moment, shear and torque diagrams without any plotting, for sweeps over many cases
+        return self.evaluateDiagrams(V, rho)
+
+    def diagramTitle(self, V):
+        return "Diagrams over half of the wing\n for V={} [m/s], n={} and fuel level={}".format(V, self.loadFactor, self.fuelLevel)
+
+    def plotDiagrams(self, V, filename=None, diagrams=None, show=False):
+        #plots the last computed diagrams, see LoadingPlots.plotDiagrams. matplotlib is only imported here
+        from LoadingPlots import plotDiagrams
+        return plotDiagrams(diagrams or self.diagrams, self.diagramTitle(V), filename, show)
+
+    def genDiagrams(self, V, rho, filename=None, show=False):
+        diagrams = self.computeDiagrams(V, rho)
+        self.plotDiagrams(V, filename, diagrams, show)
+        return diagrams
+
     def tipDeflection(self, t, tskin = None): #determines the tip defelction given a spar thickness. Uses the last call to gen diagrams
+        #t (and tskin) can be arrays of candidate thicknesses, all evaluated at once: the results are then arrays with one value per candidate
         Lseg = (self.b/2)/self.segmentcount
         E = 71.7*(10**9)
-        moments = self.diagrams["Moment"]["Ms"]
-        stress = []
-        deltas = []
-        Is = []
-        for i in range(len(self.__segments)):
-            seg = self.__segments[i]
-            I = 2*((1/12)*t*seg[7]**3)
-            I += 2*tskin*0.45*seg[6]*(seg[7]/2)**2 if tskin != None else 0.0
-            Is.append(I)
-            EI = E*I
-            EI2 = E*2*((1/12)*t*self.__segments[i-1][7]**3) if i>0 else EI
-            delta = (moments[i+1]*Lseg**2)/(2*EI) 
-            delta += Lseg*(moments[i]*Lseg)/(EI2)#if i>0 else 0.0
-            deltas.append(delta)
-            stress.append((moments[i+1]*seg[7]/2)/I)
-
-        self.diagrams.update({"BendStiffness":{"Is": Is}})
-        return (sum(deltas), max(stress))
-
-    def getRequiredThicknessDefl(self,delta, tskin=None):#returns the required thickness for a given deflection
-        t = 0.00001
-        d = 0.0
+        moments = np.asarray(self.diagrams["Moment"]["Ms"])
+        h = self.__segments["h"]
+        candidates = np.ndim(t) > 0 or np.ndim(tskin) > 0
+        t = np.asarray(t, dtype=np.float64)[..., np.newaxis]    #candidates x segments
+        I = 2*((1/12)*t*h**3)
+        if tskin is not None: I = I + 2*np.asarray(tskin)[..., np.newaxis]*0.45*self.__segments["cr"]*(h/2)**2
+        EI = E*I
+        EI2 = E*2*((1/12)*t*h[:-1]**3)   #spar of the previous segment only
+        EI2 = np.concatenate([EI[..., :1], np.broadcast_to(EI2, EI.shape[:-1]+EI2.shape[-1:])], axis=-1)
+        deltas = (moments[1:]*Lseg**2)/(2*EI) + Lseg*(moments[:-1]*Lseg)/(EI2)
+        stress = (moments[1:]*h/2)/I
+        if candidates:
+            return (np.sum(deltas, axis=-1), np.max(stress, axis=-1))
+
+        self.diagrams.update({"BendStiffness":{"Is": I.tolist()}})
+        return (float(np.sum(deltas)), float(np.max(stress)))
+
+    def getRequiredThicknessDefl(self,delta, tskin=None, method="step", tol=0.00001):#returns the required thickness for a given deflection
         Syield = 490*(10**6)
-        while t < 0.5:
-            d = self.tipDeflection(t,tskin)
-            if d[0]<delta and d[1]<Syield:
-                break
-            t+=0.00001
-        if t >= 0.5: 
-            print("No answer reached until a required thickness of 0.5m")
-            return None
-        else:
-            return (t,d[0])
+        if method == "bisect":
+            return self._bisectThickness(lambda t: self.tipDeflection(t,tskin), (delta, Syield), ("deflection", "stress"), tol)
+        return self._stepThickness(lambda t: self.tipDeflection(t,tskin), (delta, Syield))
 
     def tipTwist(self, tspar, ti):
+        #tspar or ti can be arrays of candidate thicknesses, see tipDeflection
         Lseg = (self.b/2)/self.segmentcount
         G = 26.9*(10**9)
-        torques = self.diagrams["Torque"]["Ts"]
-        shears = []
-        thetas = []
-        Js = []
-        for i in range(len(self.__segments)):
-            seg = self.__segments[i]
-            theta = (Lseg/G)*torques[i]
-            theta *= (1/(4*(seg[7]*0.45*seg[6])**2))
-            theta *= ( (2*seg[7])/(tspar) + (2*0.45*seg[6])/(ti) )
-            J = (4*(seg[7]*0.45*seg[6])**2)/( (2*seg[7])/(tspar) + (2*0.45*seg[6])/(ti) )
-            Js.append(J)
-            thetas.append(theta)
-            shears.append(torques[i]/(2*ti*(seg[7]*0.45*seg[6])))
-        self.diagrams.update({"TorStiffness":{"Js": Js}})
-        return (sum(thetas), max(shears))
-
-    def getRequiredThicknessTwist(self, theta, tspar): #returns the required sheet thikness for a given twist. theta in deg
-        t = 0.00001
-        th = 0.0
+        torques = np.asarray(self.diagrams["Torque"]["Ts"])
+        h = self.__segments["h"]
+        candidates = np.ndim(tspar) > 0 or np.ndim(ti) > 0
+        tspar = np.asarray(tspar, dtype=np.float64)[..., np.newaxis]
+        ti = np.asarray(ti, dtype=np.float64)[..., np.newaxis]
+        A = h*0.45*self.__segments["cr"]     #enclosed area of the wing box
+        walls = (2*h)/(tspar) + (2*0.45*self.__segments["cr"])/(ti)
+        thetas = (Lseg/G)*torques*(1/(4*A**2))*walls
+        shears = torques/(2*ti*A)
+        if candidates:
+            return (np.sum(thetas, axis=-1), np.max(np.broadcast_to(shears, thetas.shape), axis=-1))
+
+        Js = (4*A**2)/walls
+        self.diagrams.update({"TorStiffness":{"Js": Js.tolist()}})
+        return (float(np.sum(thetas)), float(np.max(shears)))
+
+    def getRequiredThicknessTwist(self, theta, tspar, method="step", tol=0.00001): #returns the required sheet thikness for a given twist. theta in deg
         Tmax = 324*(10**6)
         theta = radians(theta)
-        while t < 0.5:
-            th = self.tipTwist(tspar, t)
-            if th[0]<theta and th[1]<Tmax:
-                break
-            t+=0.00001
-        if t >= 0.5: 
-            print("No answer reached until a required thickness of 0.5m")
+        if method == "bisect":
+            return self._bisectThickness(lambda t: self.tipTwist(tspar, t), (theta, Tmax), ("twist", "shear"), tol)
+        return self._stepThickness(lambda t: self.tipTwist(tspar, t), (theta, Tmax))
+
+    def _stepThickness(self, evaluate, limits, step=0.00001, tmax=0.5):
+        #smallest thickness of the grid step, 2*step, ... below tmax where every value of evaluate(t) is below its limit.
+        #candidates are evaluated in growing blocks with one array call each; the grid is built by repeated addition like the original loop
+        grid = np.add.accumulate(np.full(int(tmax/step)+2, step))
+        grid = grid[grid < tmax]
+        start, block = 0, 64
+        while start < len(grid):
+            ts = grid[start:start+block]
+            values = evaluate(ts)
+            ok = np.logical_and.reduce([value < limit for value, limit in zip(values, limits)])
+            if ok.any():
+                t = float(ts[np.argmax(ok)])
+                return (t, evaluate(t)[0]) #the scalar call also leaves the stiffness distribution of the answer in self.diagrams
+            start += block
+            block = min(block*2, max(64, 2**22//self.segmentcount))
+        print("No answer reached until a required thickness of {}m".format(tmax))
+        return None
+
+    def _bisectThickness(self, evaluate, limits, names, tol, tmin=0.00001, tmax=0.5):
+        #bisection for the smallest thickness in [tmin, tmax] where every value of evaluate(t) is below its limit.
+        #all constraints decrease monotonically with the thickness. returns (t, first value, iterations, binding constraint)
+        def violation(values):
+            #largest value/limit ratio of the violated constraints, None if all are satisfied
+            ratios = [(v/l, name) for v, l, name in zip(values, limits, names) if not v < l]
+            return max(ratios)[1] if ratios else None
+
+        hiValues = evaluate(tmax)
+        iterations = 1
+        if violation(hiValues) is not None:
+            print("No answer reached until a required thickness of {}m".format(tmax))
             return None
-        else:
-            return (t,th[0])
-        pass
+        loValues = evaluate(tmin)
+        iterations += 1
+        if violation(loValues) is None:
+            return (tmin, loValues[0], iterations, "minimum thickness")
+        lo, hi = tmin, tmax
+        while hi - lo > tol:
+            t = (lo + hi)/2
+            values = evaluate(t)
+            iterations += 1
+            if violation(values) is None:
+                hi, hiValues = t, values
+            else:
+                lo, loValues = t, values
+        evaluate(hi) #leave the stiffness distribution of the answer in self.diagrams
+        return (hi, hiValues[0], iterations, violation(loValues))
 
-    def getRequiredThickness(self, delta, theta): #returns the spar and skin thickness required for the given deflection and twist. theta in deg
-        tspar = self.getRequiredThicknessDefl(delta)
-        tskin = self.getRequiredThicknessTwist(theta, tspar[0])
+    def getRequiredThickness(self, delta, theta, method="step", tol=0.00001): #returns the spar and skin thickness required for the given deflection and twist. theta in deg
+        #with method="bisect" the spar and skin results, including iteration counts and binding constraints, are kept in self.sizing
+        tspar = self.getRequiredThicknessDefl(delta, method=method, tol=tol)
+        tskin = self.getRequiredThicknessTwist(theta, tspar[0], method=method, tol=tol)
         for i in range(3):
             print(tspar[0], tskin[0])
-            tspar = self.getRequiredThicknessDefl(delta, tskin[0])
-            tskin = self.getRequiredThicknessTwist(theta, tspar[0])
+            tspar = self.getRequiredThicknessDefl(delta, tskin[0], method=method, tol=tol)
+            tskin = self.getRequiredThicknessTwist(theta, tspar[0], method=method, tol=tol)
+        self.sizing = {"spar": tspar, "skin": tskin}
         return (tspar[0], tskin[0])
\ No newline at end of file
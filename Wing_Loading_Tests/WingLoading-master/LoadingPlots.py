@@ -0,0 +1,38 @@
+#plotting of the loading diagrams, kept apart from LoadingDiagram so computing diagrams never imports matplotlib.
+#pyplot comes from the shared Aero_Plotting helpers of the repository root
+from Aero_Plotting import finish_figure, get_pyplot, render_batch
+
+def _plotDiagram(plt, position, ax1, Xs, Ys, ylabel, last=False):
+    ax = plt.subplot(position, sharex=ax1)
+    plt.plot(Xs, Ys)
+    plt.xlim(xmin=0.0)
+    if Ys[0] > 0:
+        plt.ylim(ymin=0.0)
+    else:
+        plt.ylim(ymax=0.0)
+    plt.ylabel(ylabel)
+    plt.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
+    if last:
+        plt.xlabel("x position along the wing [m]")
+    else:
+        plt.setp(ax.get_xticklabels(), visible=False)
+    return ax
+
+def plotDiagrams(diagrams, title, filename=None, show=False):
+    #draws the moment, shear and torque diagrams of LoadingDiagram.computeDiagrams. Saved as <filename>.png and shown on screen for show=True
+    plt = get_pyplot(interactive=show)
+    ax1 = _plotDiagram(plt, 311, None, diagrams["Moment"]["Xs"], diagrams["Moment"]["Ms"], "Moment [N*m]")
+    plt.title(title)
+    _plotDiagram(plt, 312, ax1, diagrams["Shear"]["Xs"], diagrams["Shear"]["Vs"], "Shear [N]")
+    _plotDiagram(plt, 313, ax1, diagrams["Torque"]["Xs"], diagrams["Torque"]["Ts"], "Torque [N*m]", last=True)
+
+    if filename!=None:
+        filename = filename.split(".")[0]+".png"
+    finish_figure(plt, filename, show)
+    if filename!=None:
+        print("Plots saved to file")
+    return filename
+
+def renderDiagrams(jobs, maxWorkers=None):
+    #renders many cases in a process pool. jobs is a list of (diagrams, title, filename). returns the written files in order
+    return render_batch(plotDiagrams, [tuple(job)+(False,) for job in jobs], maxWorkers)
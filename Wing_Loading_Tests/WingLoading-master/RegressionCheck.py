@@ -0,0 +1,91 @@
+from LoadingDiagram import LoadingDiagram as LD
+import numpy as np
+
+#Diagrams of the case1 wing from main.py at segmentcount=20, V=148 [m/s], rho=1.225, n=3.1 and fuel level 0.7
+#recorded with the original segment by segment summation
+REFERENCE = {
+    "Ms": [13175.488045701766, 13774.915725941646, 14066.132171010495, 14081.468614442536, 13851.689748619814,
+           13405.993724772226, 12772.012152977508, 11975.810102161238, 11041.886100096834, 9993.17213340555,
+           8851.033647556482, 7635.269546866572, 6364.1121945006, 5054.227412471181, 3720.714481638781,
+           2512.5309215561847, 1562.7754030240137, 854.0462388222894, 368.94174173103136, 90.06022453026056, 0],
+    "Vs": [-6665.021206062694, -3823.65211397018, -1271.9987183806734, 1003.6445025969915, 3016.9830708539675,
+           4781.722508281413, 6311.5683367704905, 7620.226078212353, 8721.401254498163, 9628.799387519077,
+           10356.125999166252, 10917.086611330851, 11325.38674590403, 11594.731924776948, 11738.827669840764,
+           9401.74206038834, 7216.902183394167, 5184.3080388582475, 3303.959626780579, 1575.8569471611636, 0],
+    "Ts": [6772.0781626569515, 5775.067687359574, 4886.934239785637, 4099.998118372686, 3406.8423542403434,
+           2800.3127111903195, 2273.5176857064075, 1819.8285069544838, 1432.87913678251, 1106.5662697205296,
+           835.0493329806696, 612.7504864571421, 434.35462272624204, 294.8093670463484, 189.32507735792333,
+           110.95035326958312, 54.412948442686904, 17.38103678975761, -2.4772077766819844, -7.493611344108794],
+}
+
+def referenceCase():
+    case = LD(
+                4.572,   #wingspan [m]
+                0.9144,      #rootchord [m]
+                0.33,   #taperratio
+                0,     #sweep0.25c [deg]
+                5,    #AoA [deg]
+                3.1,    #load factor
+                [(1.165, 5, 0.0), (0.55, 5.723848, 0.7)],
+                [(-0.1507, 0.252101, 0.0),(-0.1147, 0.257831, 0.7)],
+                [( 0.14 ,0.0),(0.1,0.7)]
+                )
+    case.segmentcount = 20
+    case.fuelLevel = 0.7
+    case.generateSegments()
+    return case
+
+def checkDiagrams(rtol=1e-9, atol=1e-6):
+    #compares the moment, shear and torque diagrams against the recorded reference. Raises AssertionError on a mismatch
+    case = referenceCase()
+    diagrams = {
+        "Ms": case.genMomentDiagram(148, 1.225)["Ms"],
+        "Vs": case.genShearDiagram(148, 1.225)["Vs"],
+        "Ts": case.genTorqueDiagram(148, 1.225)["Ts"]
+    }
+    for key, reference in REFERENCE.items():
+        if not np.allclose(diagrams[key], reference, rtol=rtol, atol=atol):
+            raise AssertionError("{} diagram differs from the reference: {} != {}".format(key, diagrams[key], reference))
+    print("Diagrams match the reference at segmentcount=20")
+    return True
+
+#full-tank fuel weight of half of the wing: 11826.759 [kg] of fuel times 9.81, in [N] (not kg)
+FUEL_WEIGHT_REFERENCE = 116020.50579
+
+def checkFuelWeight(segmentcounts=(5, 20, 200)):
+    #the full-tank fuel weight [N] of getFuelWeight does not depend on the segmentcount
+    case = referenceCase()
+    for n in segmentcounts:
+        case.segmentcount = n
+        case.generateSegments()
+        total = sum(case.getFuelWeight(i/n, (i+1)/n) for i in range(n))
+        if not np.isclose(total, FUEL_WEIGHT_REFERENCE, rtol=1e-9, atol=0):
+            raise AssertionError("fuel weight {} [N] at segmentcount={} differs from {} [N]".format(total, n, FUEL_WEIGHT_REFERENCE))
+    print("Full-tank fuel weight is {} [N] ({:.3f} [kg]) for every segmentcount".format(FUEL_WEIGHT_REFERENCE, FUEL_WEIGHT_REFERENCE/9.81))
+    return True
+
+def checkBreakpoints():
+    #tables whose first breakpoint is not at x=0: constant before the first breakpoint, linear in x - x1 between the breakpoints
+    #and constant after the last one, as documented in LoadingDiagram.__init__. The code before the vectorized interpolation
+    #used x instead of x - x1 there, which jumped at the first breakpoint, so these values are not a comparison with it
+    case = LD(4.572, 0.9144, 0.33, 0, 0, 1.0,
+              [(0.5, 0.0, 0.2), (0.3, 0.0, 0.8)],
+              [(-0.1, 0.0, 0.2), (-0.2, 0.0, 0.8)],
+              [(0.14, 0.2), (0.1, 0.8)])
+    xs = np.array([0.0, 0.1, 0.2, 0.5, 0.8, 0.9, 1.0])
+    expected = {
+        "cl": [0.5, 0.5, 0.5, 0.4, 0.3, 0.3, 0.3],
+        "cm": [-0.1, -0.1, -0.1, -0.15, -0.2, -0.2, -0.2],
+        "tc": [0.14, 0.14, 0.14, 0.12, 0.1, 0.1, 0.1]
+    }
+    values = {"cl": case.getCl(xs, xs), "cm": case.getCm(xs, xs), "tc": case.getThickness(xs, 1.0)}
+    for key, reference in expected.items():
+        if not np.allclose(values[key], reference, rtol=0, atol=1e-12):
+            raise AssertionError("{} breakpoints interpolate to {} instead of {}".format(key, values[key], reference))
+    print("Breakpoint tables starting after x=0 interpolate as documented")
+    return True
+
+if __name__ == "__main__":
+    checkDiagrams()
+    checkFuelWeight()
+    checkBreakpoints()
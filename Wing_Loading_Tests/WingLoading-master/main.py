@@ -1,5 +1,6 @@
 from LoadingDiagram import LoadingDiagram as LD
-import matplotlib.pyplot as plt
+from Aero_Plotting import get_pyplot
+from Result_Store import ResultStore
 
 def saveToFile(filename , diagram, lift=None, stiffnesses = False):
     outfile = open(filename, "w")
@@ -20,8 +21,27 @@ def saveToFile(filename , diagram, lift=None, stiffnesses = False):
 
     outfile.close()
 
+def saveToStore(store, name, diagram, lift=None, meta=None):
+    #appends the diagrams (and lift distribution) of a case to a Result_Store.ResultStore folder, in binary columns instead of text lines
+    if not isinstance(store, ResultStore):
+        store = ResultStore(store)
+    columns = {
+        "x_moment": diagram["Moment"]["Xs"], "moment": diagram["Moment"]["Ms"],
+        "x_shear": diagram["Shear"]["Xs"], "shear": diagram["Shear"]["Vs"],
+        "x_torque": diagram["Torque"]["Xs"], "torque": diagram["Torque"]["Ts"]
+    }
+    if "BendStiffness" in diagram:
+        columns["bend_stiffness"] = diagram["BendStiffness"]["Is"]
+    if "TorStiffness" in diagram:
+        columns["tor_stiffness"] = diagram["TorStiffness"]["Js"]
+    if lift != None:
+        columns["x_lift"] = lift["Xs"]
+        columns["lift"] = lift["Ls"]
+    return store.append(name, meta, **columns)
+
 def plotStiffnessDift(filename, diagram, segments):
     if "BendStiffness" in diagram:
+        plt = get_pyplot()
         Xs = []
         for i in range(len(segments)):
             seg = segments[i]
@@ -156,6 +176,7 @@ def main():
     print(case1.getRequiredThickness(6.16, 10.0))
     print(case1.diagrams["BendStiffness"]["Is"])
     saveToFile("case1.txt", diagram1, lift1, stiffnesses=True)
+    saveToStore("results", "case1", diagram1, lift1, {"V": 148, "rho": 1.225, "n": case1.loadFactor, "fuelLevel": case1.fuelLevel})
     plotStiffnessDift("case1_stiffness.png", case1.diagrams,case1.getSegments())
 
     case1.fuelLevel = 0.7
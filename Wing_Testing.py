@@ -3,9 +3,17 @@ import aerosandbox.numpy as np
 import matplotlib.pyplot as plt
 import aerosandbox.tools.pretty_plots as p
 import logging
+from Aero_Logging import configure_logging
+from Airfoil_Polars import get_polar, registry as polar_registry
+from Lifting_Line import LiftingLine
+from VLM_Cache import cached_vlm_run
+from LD_Surrogate import optimize_lift_to_drag
+
+# Set to True to optimize L/D on a VLM surrogate instead of differentiating through the VLM with asb.Opti
+USE_SURROGATE = False
 
 # Configure logging to log everything (DEBUG level and above) and write to a file
-logging.basicConfig(filename='Wing_Test_log.txt', filemode='a', level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+configure_logging('Wing_Test_log.txt', logging.DEBUG)
 
 # Define airfoils
 logging.debug("Defining airfoils")
@@ -46,53 +54,78 @@ airplane = asb.Airplane(
 
 # Debugging output for wing section coordinates
 for i, xsec in enumerate(airplane.wings[0].xsecs):
-    logging.debug(f"Wing section {i} leading edge coordinates: {xsec.xyz_le}")
+    logging.debug("Wing section %d leading edge coordinates: %s", i, xsec.xyz_le)
 
-# Set up and run VLM analysis
+# Set up and run VLM analysis, reusing the cached result when the wing and operating point are unchanged
 logging.debug("Setting up and running VLM analysis")
-vlm = asb.VortexLatticeMethod(
-    airplane=airplane,
-    op_point=asb.OperatingPoint(velocity=9.7536, alpha=5) #velocity=m/s and alpha=degrees
+aero, panels, vlm = cached_vlm_run(
+    airplane,
+    asb.OperatingPoint(velocity=9.7536, alpha=5) #velocity=m/s and alpha=degrees
 )
-aero = vlm.run()
 for k, v in aero.items():
-    logging.info(f"{k.rjust(4)} : {v}")
+    logging.info("%4s : %s", k, v)
 
-# Draw VLM results
-logging.debug("Drawing VLM results")
-vlm.draw(show_kwargs=dict(jupyter_backend="static"))
-logging.info("VLM results drawn")
+# Draw VLM results (only available when the VLM was actually solved)
+if vlm is not None:
+    logging.debug("Drawing VLM results")
+    vlm.draw(show_kwargs=dict(jupyter_backend="static"))
+    logging.info("VLM results drawn")
+else:
+    logging.info("VLM results read from the cache, nothing to draw")
 
-# Set up optimization problem to maximize L/D
-logging.debug("Setting up optimization problem to maximize L/D")
-opti = asb.Opti()
-alpha = opti.variable(init_guess=5, lower_bound=0, upper_bound=10)  # Set bounds for alpha
-vlm = asb.VortexLatticeMethod(
-    airplane=airplane,
-    op_point=asb.OperatingPoint(velocity=9.7536, alpha=alpha), #velocity=m/s
-    align_trailing_vortices_with_wind=False,
-)
-aero = vlm.run()
-L_over_D = aero["CL"] / aero["CD"]
-logging.debug(f"Initial L/D: {L_over_D}")
+# Alpha sweep of the same planform with the lifting-line model: the system is factored
+# once and every alpha is solved together, instead of one VLM run per alpha. The section
+# lift slope and zero-lift angle come from the goe227 polar (the GOE polar of Lift_Calculator,
+# Polars/goe_default.dat, until a goe227 polar file is added to Polars/)
+logging.debug("Running lifting-line alpha sweep")
+wing_polar = get_polar("goe227") if "goe227" in polar_registry.available() else get_polar()
+lifting_line = LiftingLine.from_polar(2 * 2.286, 0.9144, 0.3048, wing_polar)  # Span, root and tip chord of the wing above (m)
+logging.info("Lifting line sections from polar %s: lift slope %.3f /rad, zero-lift alpha %.2f deg",
+             wing_polar.name, lifting_line.lift_slope[0], lifting_line.zero_lift_alpha[0])
+sweep = lifting_line.sweep(np.linspace(0, 10, 21))
+for alpha_i, CL_i, CDi_i in zip(sweep["alpha"], sweep["CL"], sweep["CDi"]):
+    logging.info("Lifting line alpha %5.2f deg : CL %.4f, CDi %.5f", alpha_i, CL_i, CDi_i)
+
+# Maximize L/D. The surrogate samples the VLM at a few alphas and optimizes a fitted
+# CL/CD model (verified with one more VLM solve) when USE_SURROGATE is set; by
+# default L/D is optimized through the full VLM with asb.Opti
+if USE_SURROGATE:
+    logging.debug("Optimizing L/D on the VLM surrogate")
+    surrogate_result = optimize_lift_to_drag(airplane, velocity=9.7536, alpha_bounds=(0, 10), #velocity=m/s
+                                             align_trailing_vortices_with_wind=False)
+    best_alpha = surrogate_result["alpha"]
+    logging.info("Max L/D: %.4f with %d VLM solves", surrogate_result["L_over_D"], surrogate_result["vlm_solves"])
+else:
+    # Set up optimization problem to maximize L/D
+    logging.debug("Setting up optimization problem to maximize L/D")
+    opti = asb.Opti()
+    alpha = opti.variable(init_guess=5, lower_bound=0, upper_bound=10)  # Set bounds for alpha
+    vlm = asb.VortexLatticeMethod(
+        airplane=airplane,
+        op_point=asb.OperatingPoint(velocity=9.7536, alpha=alpha), #velocity=m/s
+        align_trailing_vortices_with_wind=False,
+    )
+    aero = vlm.run()
+    L_over_D = aero["CL"] / aero["CD"]
+    logging.debug("Initial L/D: %s", L_over_D)
 
-opti.minimize(-L_over_D)
+    opti.minimize(-L_over_D)
 
-# Adjust solver options
-opti.solver_options = {
-    "ipopt.max_iter": 1000,  # Increase maximum number of iterations
-    "ipopt.tol": 1e-6,       # Adjust tolerance level
-}
+    # Adjust solver options
+    opti.solver_options = {
+        "ipopt.max_iter": 1000,  # Increase maximum number of iterations
+        "ipopt.tol": 1e-6,       # Adjust tolerance level
+    }
 
-try:
-    sol = opti.solve()
-except RuntimeError as e:
-    logging.error("Solver failed. Investigating variable values...")
-    alpha_value = opti.debug.value(alpha)
-    logging.debug(f"Alpha value at failure: {alpha_value}")
-    raise e
-best_alpha = sol(alpha)
-logging.info(f"Alpha for max L/D: {best_alpha:.3f} deg")
+    try:
+        sol = opti.solve()
+    except RuntimeError as e:
+        logging.error("Solver failed. Investigating variable values...")
+        alpha_value = opti.debug.value(alpha)
+        logging.debug("Alpha value at failure: %s", alpha_value)
+        raise e
+    best_alpha = sol(alpha)
+logging.info("Alpha for max L/D: %.3f deg", best_alpha)
 
 # # Set up optimization problem to optimize wing chord distribution
 # logging.debug("Setting up optimization problem to optimize wing chord distribution")
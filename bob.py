@@ -1,8 +1,11 @@
 
 import os
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
+from Aero_Logging import log_stations, start_async_logging
+from Aero_Plotting import finish_figure, get_pyplot
+
+logger = logging.getLogger(__name__)
 
 class EllipticalLiftDistribution:
     def __init__(self, span, lift_coefficient, rho, velocity, root_chord, tip_chord, output_folder='Wing_Loading', design_load=1.5):
@@ -15,7 +18,7 @@ class EllipticalLiftDistribution:
         self.output_folder = output_folder
         self.design_load = design_load
         os.makedirs(self.output_folder, exist_ok=True)
-        logging.info(f"Parameters: span={span} in, lift_coefficient={lift_coefficient}, rho={rho}, velocity={velocity} ft/s, root_chord={root_chord} in, tip_chord={tip_chord} in")
+        logger.info("Parameters: span=%s in, lift_coefficient=%s, rho=%s, velocity=%s ft/s, root_chord=%s in, tip_chord=%s in", span, lift_coefficient, rho, velocity, root_chord, tip_chord)
 
     # Calculate lift at a given spanwise position
     def lift_at_position(self, y_position):
@@ -43,10 +46,8 @@ class EllipticalLiftDistribution:
             delta_pos = positions[i + 1] - positions[i]
             loads[i] = lifts_and_chords[i][0] * delta_pos
             torsional_loads[i] = self.torsional_load_at_position(lifts_and_chords[i][0], lifts_and_chords[i][1])
-            logging.info(f"Position {positions[i]:.2f} in, Lift {lifts_and_chords[i][0]:.2f} lb/in, Delta Pos {delta_pos:.2f} in, Load {loads[i]:.2f} lb, Torsional Load {torsional_loads[i]:.2f} lb-in")
         loads[-1] = lifts_and_chords[-1][0] * (positions[-1] - positions[-2])
         torsional_loads[-1] = self.torsional_load_at_position(lifts_and_chords[-1][0], lifts_and_chords[-1][1])
-        logging.info(f"Position {positions[-1]:.2f} in, Lift {lifts_and_chords[-1][0]:.2f} lb/in, Delta Pos {positions[-1] - positions[-2]:.2f} in, Load {loads[-1]:.2f} lb, Torsional Load {torsional_loads[-1]:.2f} lb-in")
 
         shear_forces = np.zeros(len(positions))
         for i in range(len(positions) - 1, -1, -1):
@@ -54,7 +55,6 @@ class EllipticalLiftDistribution:
                 shear_forces[i] = 0  # Shear force at the wing tip is zero
             else:
                 shear_forces[i] = shear_forces[i + 1] + loads[i]
-            logging.info(f"Position {positions[i]:.2f} in, Shear Force {shear_forces[i]:.2f} lb")
 
         bending_moments = np.zeros(len(positions))
         for i in range(len(positions) - 1, -1, -1):
@@ -63,7 +63,6 @@ class EllipticalLiftDistribution:
             else:
                 delta_pos = positions[i + 1] - positions[i]
                 bending_moments[i] = bending_moments[i + 1] + shear_forces[i] * delta_pos
-            logging.info(f"Position {positions[i]:.2f} in, Bending Moment {bending_moments[i]:.2f} lb-in")
 
         # Apply 30% safety factor
         safety_factor = 1.3
@@ -72,10 +71,15 @@ class EllipticalLiftDistribution:
         bending_moments *= safety_factor
         torsional_loads *= safety_factor
 
+        if logger.isEnabledFor(logging.INFO):
+            log_stations(logger, "Load distribution (with safety factor)", position=positions, lift=[lift for lift, _ in lifts_and_chords],
+                         load=loads, shear_force=shear_forces, bending_moment=bending_moments, torsional_load=torsional_loads)
+
         return lifts_and_chords, loads, shear_forces, bending_moments, torsional_loads
 
     # Plot distributions
-    def plot_distribution(self, positions, values, ylabel, title, filename, figure_num, color='b', fontweight='normal'):
+    def plot_distribution(self, positions, values, ylabel, title, filename, figure_num, color='b', fontweight='normal', show=False):
+        plt = get_pyplot(interactive=show)
         plt.figure(num=figure_num, figsize=(10, 6))
         plt.plot(positions, values, '-o', label=title, color=color)
         plt.xlabel('Spanwise Position (in)')
@@ -83,14 +87,15 @@ class EllipticalLiftDistribution:
         plt.title(f"{title}\nVelocity: {self.velocity} ft/s, Lift Coefficient: {self.lift_coefficient}, Air Density: {self.rho} slugs/ft³", fontweight=fontweight)
         plt.legend()
         plt.grid(True)
-        plt.savefig(os.path.join(self.output_folder, filename))
-        plt.show()
-        logging.info(f"Plotted and saved the {title.lower()}")
+        finish_figure(plt, os.path.join(self.output_folder, filename), show)
+        logger.info("Plotted and saved the %s", title.lower())
 
     # Log results
     def log_results(self, positions, lifts_chords_loads_shear_moment):
-        for pos, (lift, chord, load, shear_force, bending_moment, torsional_load) in zip(positions, lifts_chords_loads_shear_moment):
-            logging.info(f"Lift per unit span at {pos:.2f} in: {lift:.2f} lb/in, Chord length: {chord:.2f} in, Load: {load:.2f} lb, Shear force: {shear_force:.2f} lb, Bending moment: {bending_moment:.2f} lb-in, Torsional load: {torsional_load:.2f} lb-in")
+        if logger.isEnabledFor(logging.INFO):
+            lift, chord, load, shear_force, bending_moment, torsional_load = zip(*lifts_chords_loads_shear_moment)
+            log_stations(logger, "Results per spanwise position (in, lb/in, in, lb, lb, lb-in, lb-in)", position=positions, lift=lift, chord=chord,
+                         load=load, shear_force=shear_force, bending_moment=bending_moment, torsional_load=torsional_load)
 
     # Size the spar
     def size_spar(self, bending_moments, yield_strength):
@@ -125,18 +130,17 @@ class EllipticalLiftDistribution:
         # Determine the maximum bending moment the spar can handle
         max_bending_moment_handled = final_section_modulus * yield_strength / self.design_load
 
-        logging.info(f"Max bending moment: {max_bending_moment:.2f} lb-in")
-        logging.info(f"Required section modulus: {required_section_modulus:.2f} in^3")
-        logging.info(f"Spar dimensions: height = {h:.2f} in, width = {b:.2f} in")
-        logging.info(f"Max bending moment the spar can handle: {max_bending_moment_handled:.2f} lb-in")
+        logger.info("Max bending moment: %.2f lb-in", max_bending_moment)
+        logger.info("Required section modulus: %.2f in^3", required_section_modulus)
+        logger.info("Spar dimensions: height = %.2f in, width = %.2f in", h, b)
+        logger.info("Max bending moment the spar can handle: %.2f lb-in", max_bending_moment_handled)
 
         return h, b, max_bending_moment_handled
 
 # Example usage
 if __name__ == "__main__":
     # Configure logging
-    logging.basicConfig(filename='Wing_Loading_Log.log', level=logging.INFO, 
-                        format='%(asctime)s - %(levelname)s - %(message)s')
+    start_async_logging('Wing_Loading_Log.log', logging.INFO)
 
     # Define parameters in imperial units (inches)
     span = 15 * 12  # Total wingspan in inches